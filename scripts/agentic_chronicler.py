@@ -10,64 +10,161 @@ The Council:
 2.  **The Recruiter** (Impact): Drafts a "STAR" (Situation-Task-Action-Result) summary.
 3.  **The Chairman** (Synthesis): Reviews input, verifies against raw data, and produces the final output.
 
+The Council is a small dependency graph (COUNCIL): the Engineer and the
+Recruiter only read the raw context and run in parallel; the Chairman starts
+as soon as both are done.
+
+Phase outputs are kept in scripts/council_cache.json by project content
+signature, plus a hash of the job context for the phases tailored to it (the
+Recruiter and the Chairman). The Engineer never sees the job context, so every
+company page (--context) shares one analysis per project version: a new page
+costs only the Recruiter and Chairman calls, and a repeated one costs nothing.
+A council that failed partway reuses the phases it did finish on the retry.
+--regenerate asks the LLM again for the tailored phases (rather than reusing
+stored outputs or replies); --no-phase-cache skips the stored phases entirely.
+
+With a job context every selected project gets a tailored summary, even if
+the input already has an (untailored) `ai_summary`; --force is only needed to
+redo the untailored ones.
+
+Each successful LLM call is cached by provider, model, messages, temperature
+and JSON mode (scripts/llm_cache.py), so a council that failed partway - or a
+re-run - only pays for the calls that didn't succeed before. A JSON-mode reply
+is only stored once it parses, so a broken Chairman answer is asked for again.
+
+Projects are processed concurrently (--concurrency); every provider call goes
+through a shared per-provider token bucket (requests and tokens per minute,
+see `rpm` / `tpm` in PROVIDERS and scripts/llm_ratelimit.py) instead of fixed
+sleeps, and a 429 waits for the provider's `Retry-After`.
+
+Batch mode (--contexts) tailors every company page in one run: the project
+data is loaded once, each project's job-independent phases run once, and all
+(project x job) councils share one queue and the same rate limiters. Councils
+are scheduled page by page, and each page is written as soon as it is complete.
+
 Usage:
-    python scripts/agentic_chronicler.py [--dry-run] [--context <file>] [--output <file>]
+    python scripts/agentic_chronicler.py [--dry-run] [--context <file>] [--output <file>] [--concurrency 4]
+    python scripts/agentic_chronicler.py --contexts '*/job_description.md'
+    python scripts/agentic_chronicler.py --contexts '.pai/job_contexts/*.md' --batch-output '{name}/project-details.json'
 """
 
 import json
 import os
+import copy
+import glob
+import heapq
 import hashlib
 import requests
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 
+from llm_ratelimit import limiter_for, estimate_tokens, retry_after, summaries
+from llm_cache import LLMCache, PhaseCache, request_key
+
 # Load environment variables
 load_dotenv()
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 
 # Configuration
+# rpm / tpm: requests and tokens per minute allowed by the provider (free tiers; raise them for paid plans)
 PROVIDERS = {
     "openrouter": {
         "url": "https://openrouter.ai/api/v1/chat/completions",
         "env_key": "OPENROUTER_API_KEY",
-        "models": ["google/gemini-2.0-flash-exp:free", "meta-llama/llama-3.2-11b-vision-instruct:free"]
+        "models": ["google/gemini-2.0-flash-exp:free", "meta-llama/llama-3.2-11b-vision-instruct:free"],
+        "rpm": 20,
+        "tpm": None
     },
     "gemini": {
         "url": "https://generativelanguage.googleapis.com/v1beta/openai/chat/completions",
         "env_key": "GEMINI_API_KEY",
-        "models": ["gemini-2.5-flash"]
+        "models": ["gemini-2.5-flash"],
+        "rpm": 10,
+        "tpm": 250000
     },
     "groq": {
         "url": "https://api.groq.com/openai/v1/chat/completions",
         "env_key": "GROQ_API_KEY",
-        "models": ["llama-3.3-70b-versatile"]
+        "models": ["llama-3.3-70b-versatile"],
+        "rpm": 30,
+        "tpm": 12000
     },
     "xai": {
         "url": "https://api.x.ai/v1/chat/completions",
         "env_key": "XAI_API_KEY",
-        "models": ["grok-2-1212", "grok-beta"]
+        "models": ["grok-2-1212", "grok-beta"],
+        "rpm": 60,
+        "tpm": None
     }
 }
 
 DEFAULT_PROVIDER = "openrouter"
+DEFAULT_CONCURRENCY = 4
 
 # Default Paths (relative to script location in scripts/)
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_PROJECT_DETAILS = os.path.join(ROOT_DIR, 'project-details.json')
 DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'summary_cache.json')
+DEFAULT_PHASE_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'council_cache.json')
+# Batch mode (--contexts): where each job description's page goes
+DEFAULT_BATCH_OUTPUT = os.path.join('{dir}', 'project-details.json')
+
+# Every successful LLM call, keyed by provider + payload (see scripts/llm_cache.py)
+LLM_CACHE = LLMCache()
 
 def get_file_hash(content):
     """Generate specific hash for content to detect changes."""
     return hashlib.md5(json.dumps(content, sort_keys=True).encode('utf-8')).hexdigest()
 
-def call_llm(messages, temperature=0.7, provider="openrouter", json_mode=False):
-    """Call LLM API based on selected provider."""
+def strip_code_fences(text):
+    """An LLM reply without the ```json fences some models wrap JSON in."""
+    return text.replace('```json', '').replace('```', '').strip()
+
+def is_json(text):
+    try:
+        json.loads(strip_code_fences(text))
+        return True
+    except json.JSONDecodeError:
+        return False
+
+def build_payload(provider, model, messages, temperature=0.7, json_mode=False):
+    """Chat completion request body for one model."""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "top_p": 1,
+        # "repetition_penalty": 1 # Not all providers support this
+    }
+    
+    if json_mode:
+        payload["response_format"] = {"type": "json_object"}
+    
+    # Gemini OpenAI compat ignores repetition_penalty usually, safest to omit unless needed
+    if provider == "openrouter":
+        payload["repetition_penalty"] = 1
+    return payload
+
+def call_llm(messages, temperature=0.7, provider="openrouter", json_mode=False, refresh=False):
+    """Call LLM API based on selected provider.
+
+    Identical earlier calls are answered from LLM_CACHE unless `refresh` is set;
+    the new reply replaces the stored one either way.
+    """
     config = PROVIDERS.get(provider)
     if not config:
         print(f"❌ Unknown provider: {provider}")
         return None
 
+    # A stored answer from any of the provider's models beats a new call
+    payloads = [build_payload(provider, model, messages, temperature, json_mode) for model in config['models']]
+    if not refresh:
+        cached = LLM_CACHE.get_any([request_key(config['url'], payload) for payload in payloads])
+        if cached is not None:
+            return cached
+
     api_key = os.getenv(config['env_key'])
     if not api_key:
         print(f"⚠️  {config['env_key']} not found. Skipping LLM call.")
@@ -84,35 +181,26 @@ def call_llm(messages, temperature=0.7, provider="openrouter", json_mode=False):
         headers["X-Title"] = "Portfolio Agentic Chronicler"
 
     # Try primary model then fallback
-    models = config['models']
+    limiter = limiter_for(provider, config)
+    estimated_tokens = estimate_tokens(messages)
     
-    for model in models:
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "top_p": 1,
-            # "repetition_penalty": 1 # Not all providers support this
-        }
-        
-        if json_mode:
-            payload["response_format"] = {"type": "json_object"}
-        
-        # Gemini OpenAI compat ignores repetition_penalty usually, safest to omit unless needed
-        if provider == "openrouter":
-            payload["repetition_penalty"] = 1
-
+    for payload in payloads:
+        model = payload['model']
         retries = 5
         base_delay = 10
 
         for attempt in range(retries):
             try:
+                reserved = limiter.acquire(estimated_tokens)
                 response = requests.post(config['url'], headers=headers, json=payload)
                 
                 if response.status_code == 429:
-                    wait_time = base_delay * (2 ** attempt)
-                    print(f"⏳ Rate limit hit. Waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                    # Honour the provider's Retry-After; back off exponentially only if it doesn't send one
+                    wait_time = retry_after(response.headers)
+                    if wait_time is None:
+                        wait_time = base_delay * (2 ** attempt)
+                    print(f"⏳ Rate limit hit ({provider}). Waiting {wait_time:.0f}s...")
+                    limiter.pause(wait_time)
                     continue
 
                 if response.status_code in [404, 400, 402]:
@@ -124,9 +212,14 @@ def call_llm(messages, temperature=0.7, provider="openrouter", json_mode=False):
                     
                 response.raise_for_status()
                 data = response.json()
+                limiter.settle(reserved, (data.get('usage') or {}).get('total_tokens'))
                 
                 if 'choices' in data and len(data['choices']) > 0:
-                    return data['choices'][0]['message']['content']
+                    content = data['choices'][0]['message']['content']
+                    # A JSON-mode reply that doesn't parse is returned (the caller reports it) but never stored
+                    if not json_mode or is_json(content):
+                        LLM_CACHE.put(request_key(config['url'], payload), content, provider, model)
+                    return content
                 else:
                     print(f"❌ Unexpected API response: {data}")
                     return None
@@ -140,42 +233,18 @@ def call_llm(messages, temperature=0.7, provider="openrouter", json_mode=False):
     print("❌ All models failed.")
     return None
 
-def run_council(project_name, readme, recent_commits, file_structure, job_context=None, provider="openrouter"):
-    """Execute the Council workflow for a single project, optionally tailored to a job context."""
-    
-    print(f"  🤖 Convening Council for: {project_name}")
-    
-    context = f"""
-    PROJECT: {project_name}
-    
-    FILES/STRUCTURE:
-    {json.dumps(file_structure[:50], indent=2)}
-    
-    RECENT COMMITS:
-    {json.dumps(recent_commits, indent=2)}
-    
-    README (Truncated):
-    {readme[:4000] if readme else "No README available."}
-    """
-    
-    job_context_str = f"\n\nJOB CONTEXT / TARGET AUDIENCE:\n{job_context}" if job_context else ""
+def job_context_block(job_context):
+    return f"\n\nJOB CONTEXT / TARGET AUDIENCE:\n{job_context}" if job_context else ""
 
-    # --- Phase 1: The Engineer (Technical Analysis) ---
-    print("    👨‍💻 Engineer analyzing...")
-    engineer_prompt = [
+def engineer_prompt(context, job_context, inputs):
+    """The Engineer (Technical Analysis): reads the raw context only."""
+    return [
         {"role": "system", "content": "You are a Senior Staff Engineer. Analyze the provided codebase context. Identify the core technology stack, validity of the code structure, and technical complexity. Be critical. Output a bulleted technical analysis."},
         {"role": "user", "content": context}
     ]
-    technical_analysis = call_llm(engineer_prompt, temperature=0.3, provider=provider)
-    if not technical_analysis and provider != 'groq':
-        print("⚠️  Primary provider failed. Invoking Fallback (Groq 70B)...")
-        technical_analysis = call_llm(engineer_prompt, temperature=0.3, provider='groq')
-    if not technical_analysis: return None
-    time.sleep(15)
 
-    # --- Phase 2: The Recruiter (Impact Pitch) ---
-    print("    💼 Recruiter drafting...")
-    
+def recruiter_prompt(context, job_context, inputs):
+    """The Recruiter (Impact Pitch): reads the raw context only."""
     recruiter_system_content = """You are a Tech Recruiter at a FAANG company. Write a punchy, 2-3 sentence 'Elevator Pitch' for this project.
     
     Guidelines:
@@ -191,21 +260,18 @@ def run_council(project_name, readme, recent_commits, file_structure, job_contex
     """
     if job_context:
         recruiter_system_content += "\n\nCRITICAL: You must tailor this summary to specifically appeal to the following JOB CONTEXT. Highlight skills, words, and themes from the job description that match this project."
-    
-    recruiter_prompt = [
+
+    return [
         {"role": "system", "content": recruiter_system_content},
-        {"role": "user", "content": context + job_context_str}
+        {"role": "user", "content": context + job_context_block(job_context)}
     ]
-    impact_pitch = call_llm(recruiter_prompt, temperature=0.7, provider=provider)
-    if not impact_pitch and provider != 'groq':
-        print("⚠️  Primary provider failed. Invoking Fallback (Groq 70B)...")
-        impact_pitch = call_llm(recruiter_prompt, temperature=0.7, provider='groq')
-    if not impact_pitch: return None
-    time.sleep(15)
 
-    # --- Phase 3: The Chairman (Synthesis) ---
-    print("    ⚖️  Chairman synthesizing...")
-    chairman_prompt = [
+def chairman_prompt(context, job_context, inputs):
+    """The Chairman (Synthesis): needs the Engineer's and the Recruiter's output."""
+    technical_analysis = inputs['technical_analysis']
+    impact_pitch = inputs['impact_pitch']
+    job_context_str = job_context_block(job_context)
+    return [
         {"role": "system", "content": """You are the Chairman of the LLM Council. 
         Synthesize the Technical Analysis and Recruiter Pitch into a JSON object for a portfolio.
         
@@ -238,14 +304,113 @@ def run_council(project_name, readme, recent_commits, file_structure, job_contex
         {job_context_str}
         """}
     ]
-    
-    final_json_str = call_llm(chairman_prompt, temperature=0.1, provider=provider, json_mode=True)
-    if not final_json_str and provider != 'groq':
+
+# The Council as a dependency graph: output name -> phase. A phase starts as
+# soon as every output it `needs` is ready, so independent members run
+# concurrently. Add or remove members here; COUNCIL_OUTPUT is the final JSON.
+# `tailored` phases read the job context, so their cached outputs are kept per
+# job context; the others are shared by every run on the same project version.
+COUNCIL = {
+    "technical_analysis": {"member": "👨‍💻 Engineer analyzing", "needs": [], "prompt": engineer_prompt,
+                           "temperature": 0.3, "tailored": False},
+    "impact_pitch": {"member": "💼 Recruiter drafting", "needs": [], "prompt": recruiter_prompt,
+                     "temperature": 0.7, "tailored": True},
+    "final": {"member": "⚖️  Chairman synthesizing", "needs": ["technical_analysis", "impact_pitch"],
+              "prompt": chairman_prompt, "temperature": 0.1, "json_mode": True, "tailored": True}
+}
+COUNCIL_OUTPUT = "final"
+
+def call_with_fallback(messages, temperature, provider, json_mode=False, refresh=False):
+    """call_llm on `provider`, falling back to Groq if it fails."""
+    result = call_llm(messages, temperature=temperature, provider=provider, json_mode=json_mode, refresh=refresh)
+    if not result and provider != 'groq':
         print("⚠️  Primary provider failed. Invoking Fallback (Groq 70B)...")
-        final_json_str = call_llm(chairman_prompt, temperature=0.1, provider='groq', json_mode=True)
+        result = call_llm(messages, temperature=temperature, provider='groq', json_mode=json_mode, refresh=refresh)
+    return result
+
+def run_phases(phases, project_name, context, job_context=None, provider="openrouter", phase_cache=None,
+               signature=None, known=None):
+    """Run a council graph; each phase starts as soon as the outputs it needs are ready.
+
+    Outputs in `known` or already in `phase_cache` for this project `signature`
+    (and job context, for tailored phases) are reused; new ones are stored there.
+    Returns {output name: text}, or None once any phase fails.
+    """
+    unknown = {need for phase in phases.values() for need in phase['needs']} - set(phases)
+    if unknown:
+        raise ValueError(f"Council phases need unknown outputs: {sorted(unknown)}")
+
+    job_hash = get_file_hash(job_context) if job_context else None
+    def cache_args(name):
+        return (project_name, signature, name, job_hash if phases[name].get('tailored', True) else None)
+
+    def regenerate(name):
+        """--regenerate: tailored phases skip both the phase cache and the stored LLM replies."""
+        return bool(phase_cache) and not phase_cache.reuse_tailored and phases[name].get('tailored', True)
+
+    outputs = {name: output for name, output in (known or {}).items() if name in phases}
+    if phase_cache and signature:
+        for name in set(phases) - set(outputs):
+            if regenerate(name):
+                continue
+            cached = phase_cache.get(*cache_args(name))
+            if cached:
+                print(f"    ♻️  Reusing {name} for {project_name}")
+                outputs[name] = cached
+
+    running = {}   # future -> output name
+    with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+        while len(outputs) < len(phases):
+            for name, phase in phases.items():
+                ready = all(need in outputs for need in phase['needs'])
+                if ready and name not in outputs and name not in running.values():
+                    print(f"    {phase['member']} {project_name}...")
+                    messages = phase['prompt'](context, job_context, outputs)
+                    running[pool.submit(call_with_fallback, messages, phase['temperature'], provider,
+                                        phase.get('json_mode', False), regenerate(name))] = name
+            if not running:
+                raise ValueError(f"Council phases can't all run (dependency cycle): {sorted(set(phases) - set(outputs))}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                outputs[name] = future.result()
+                if not outputs[name]:
+                    for pending in running:
+                        pending.cancel()
+                    return None
+                # A JSON phase (the Chairman) is only worth keeping once it parses
+                if phase_cache and signature and (not phases[name].get('json_mode') or is_json(outputs[name])):
+                    phase_cache.put(*cache_args(name), outputs[name])
+    return outputs
+
+def council_context(project_name, readme, recent_commits, file_structure):
+    """The raw project context every Council member reads."""
+    return f"""
+    PROJECT: {project_name}
+    
+    FILES/STRUCTURE:
+    {json.dumps(file_structure[:50], indent=2)}
+    
+    RECENT COMMITS:
+    {json.dumps(recent_commits, indent=2)}
+    
+    README (Truncated):
+    {readme[:4000] if readme else "No README available."}
+    """
+
+def run_council(project_name, readme, recent_commits, file_structure, job_context=None, provider="openrouter",
+                phase_cache=None, signature=None, known=None):
+    """Execute the Council workflow for a single project, optionally tailored to a job context."""
+    
+    print(f"  🤖 Convening Council for: {project_name}")
+    
+    context = council_context(project_name, readme, recent_commits, file_structure)
+    outputs = run_phases(COUNCIL, project_name, context, job_context, provider, phase_cache, signature, known)
+    final_json_str = outputs[COUNCIL_OUTPUT] if outputs else None
     
     if final_json_str:
-        final_json_str = final_json_str.replace('```json', '').replace('```', '').strip()
+        final_json_str = strip_code_fences(final_json_str)
         try:
             data = json.loads(final_json_str)
             
@@ -287,16 +452,147 @@ def run_council(project_name, readme, recent_commits, file_structure, job_contex
             return None
     return None
 
+def apply_result(project, result):
+    """Copy a Council result onto a project entry."""
+    project['ai_summary'] = result.get('ai_summary') or result.get('summary')
+    project['ai_tags'] = result.get('ai_tags') or result.get('tags')
+    project['complexity_score'] = result.get('complexity_score') or result.get('complexity')
+
+def report_usage(phase_cache):
+    """Print rate limiter and cache stats (and close the LLM cache)."""
+    for provider, line in summaries().items():
+        print(f"🚦 {provider}: {line}")
+    print(f"♻️  {phase_cache.summary()}")
+    LLM_CACHE.close()
+
+def save_projects(path, projects):
+    print(f"\n💾 Saving updates to {path}...")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    with open(path, 'w') as f:
+        json.dump(projects, f, indent=2)
+
+def load_job_contexts(patterns, output_template):
+    """[(job description path, text, output path)] for every file matching `patterns`.
+
+    `output_template` may use {dir} (the job description's folder) and {name}
+    (its file name without extension).
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            print(f"⚠️  No job description matches: {pattern}")
+        paths.extend(path for path in matches if path not in paths)
+
+    contexts = []
+    for path in paths:
+        with open(path, 'r') as f:
+            job_context = f.read()
+        output = output_template.format(dir=os.path.dirname(path) or '.',
+                                        name=os.path.splitext(os.path.basename(path))[0])
+        contexts.append((path, job_context, output))
+    return contexts
+
+def run_batch(projects, pending, contexts, args, phase_cache):
+    """Tailor the `pending` projects to every job context through one queue.
+
+    Each project's job-independent phases run once and are shared by all its
+    councils. Councils are scheduled page by page (at most --concurrency at a
+    time), so each page is written as soon as its last council is done rather
+    than when the whole batch is.
+    """
+    if not pending:
+        print("✨ Nothing to tailor.")
+        return
+
+    shared = {name: phase for name, phase in COUNCIL.items() if not phase.get('tailored', True)}
+    positions = {id(project): i for i, project in enumerate(projects)}
+    pages = [copy.deepcopy(projects) for _ in contexts]
+    remaining = [len(pending)] * len(contexts)
+    modified = [False] * len(contexts)
+
+    def prepare(item):
+        _, name, readme, commits, files, content_signature = item
+        context = council_context(name, readme, commits, files)
+        return run_phases(shared, name, context, None, args.provider, phase_cache, content_signature)
+
+    def convene(item, job_context, known):
+        _, name, readme, commits, files, content_signature = item
+        return run_council(name, readme, commits, files, job_context, provider=args.provider,
+                           phase_cache=phase_cache, signature=content_signature, known=known)
+
+    def page_done(page):
+        path = contexts[page][2]
+        if args.dry_run or not modified[page]:
+            print(f"📄 {path}: done")
+            return
+        save_projects(path, pages[page])
+        phase_cache.save()
+
+    # (priority, seq, task, args, tag): shared phases first, then page by page in project order
+    queue = [((-1, n), n, prepare, (item,), (None, n)) for n, item in enumerate(pending)]
+    heapq.heapify(queue)
+    seq = len(queue)
+    running = {}   # future -> (page or None, pending index)
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        while queue or running:
+            while queue and len(running) < max(1, args.concurrency):
+                _, _, task, task_args, tag = heapq.heappop(queue)
+                running[pool.submit(task, *task_args)] = tag
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                page, n = running.pop(future)
+                item = pending[n]
+                if page is None:
+                    known = future.result()
+                    for job, (_, job_context, _) in enumerate(contexts):
+                        if known:
+                            heapq.heappush(queue, ((job, n), seq, convene, (item, job_context, known), (job, n)))
+                            seq += 1
+                        else:
+                            # The shared phases failed, so every council for this project would too
+                            remaining[job] -= 1
+                            if not remaining[job]:
+                                page_done(job)
+                    continue
+
+                result = future.result()
+                if result:
+                    apply_result(pages[page][positions[id(item[0])]], result)
+                    modified[page] = True
+                remaining[page] -= 1
+                if not remaining[page]:
+                    page_done(page)
+
 def main():
     parser = argparse.ArgumentParser(description="Agentic Project Chronicler")
     parser.add_argument('--input', help="Path to input JSON file (defaults to project-details.json)")
     parser.add_argument('--context', help="Path to Job Description context file (markdown)")
     parser.add_argument('--output', help="Path to output JSON file (defaults to updating project-details.json)")
+    parser.add_argument('--contexts', nargs='+', metavar='JD',
+                        help="Batch mode: job description files or globs (e.g. '*/job_description.md'), one tailored page each")
+    parser.add_argument('--batch-output', default=DEFAULT_BATCH_OUTPUT,
+                        help="Output path for each --contexts page; {dir} is the job description's folder, {name} its "
+                             "file name without extension (default: {dir}/project-details.json)")
     parser.add_argument('--provider', choices=['openrouter', 'gemini', 'groq', 'xai'], default='openrouter', help="LLM Provider")
     parser.add_argument('--force', action='store_true', help="Force regenerate summaries (ignore cache and existing)")
+    parser.add_argument('--regenerate', action='store_true',
+                        help="Ask the LLM again for the tailored Council phases instead of reusing stored outputs (implies --force)")
     parser.add_argument('--project', help="Run only for a specific project name")
     parser.add_argument('--dry-run', action='store_true', help="Don't save changes")
+    parser.add_argument('--no-phase-cache', action='store_true',
+                        help="Don't reuse Council phase outputs (e.g. the Engineer analysis) from earlier runs")
+    parser.add_argument('--no-llm-cache', action='store_true',
+                        help="Don't reuse or store individual LLM call results (.cache/llm)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Projects whose councils run at the same time (default: {DEFAULT_CONCURRENCY})")
     args = parser.parse_args()
+    args.force = args.force or args.regenerate
+    if args.contexts and (args.context or args.output):
+        parser.error("--contexts writes one page per job description; use --batch-output instead of --context/--output")
+    LLM_CACHE.enabled = not args.no_llm_cache
 
     print(f"📜 Starting Agentic Project Chronicler (Provider: {args.provider}) {'[FORCE NODE]' if args.force else ''}...")
     
@@ -316,6 +612,20 @@ def main():
             print(f"❌ Context file not found: {args.context}")
             return
 
+    contexts = []
+    if args.contexts:
+        contexts = load_job_contexts(args.contexts, args.batch_output)
+        outputs = [output for _, _, output in contexts]
+        if len(set(outputs)) < len(outputs):
+            print(f"❌ Several job descriptions map to the same --batch-output: {args.batch_output}")
+            return
+        if not contexts:
+            print("❌ No job descriptions found.")
+            return
+        print(f"🎯 Batch: {len(contexts)} job contexts")
+        for path, _, output in contexts:
+            print(f"    {path} -> {output}")
+
     # Load Data
     try:
         with open(project_details_path, 'r') as f:
@@ -329,9 +639,13 @@ def main():
     if os.path.exists(cache_path):
         with open(cache_path, 'r') as f:
             cache = json.load(f)
+    # Phase outputs are reused across job contexts and retries; --regenerate redoes the tailored ones
+    phase_cache = PhaseCache(DEFAULT_PHASE_CACHE_PATH, enabled=not args.no_phase_cache)
+    phase_cache.reuse_tailored = not args.regenerate
     
     projects_modified = False
     updated_count = 0
+    pending = []   # (project, name, readme, commits, files, content_signature) still needing a council
     
     for project in projects:
         name = project.get('name')
@@ -350,13 +664,14 @@ def main():
             'files': [f['name'] for f in files]
         })
 
-        # Skip if already has AI summary (Preserve expensive Llama generations) - UNLESS FORCED
-        if project.get('ai_summary') and not args.force:
+        # Skip if already has AI summary (Preserve expensive Llama generations) - UNLESS FORCED.
+        # A job context always gets its own tailored summary; the phase cache keeps repeats free.
+        if project.get('ai_summary') and not args.force and not job_context and not contexts:
              print(f"  ✨ Skipping {name} (AI Summary exists)")
              continue
         
         # Check Cache (ONLY if no context is provided and NOT forced)
-        if not args.force and not job_context and name in cache and cache[name].get('hash') == content_signature:
+        if not args.force and not job_context and not contexts and name in cache and cache[name].get('hash') == content_signature:
             print(f"  ⏭️  Skipping {name} (Unchanged)")
             cached_data = cache[name]['data']
             
@@ -370,14 +685,28 @@ def main():
                 project['complexity_score'] = complexity
                 projects_modified = True
             continue
-            
-        # Run Council
-        result = run_council(name, readme, commits, files, job_context, provider=args.provider)
-        
+
+        pending.append((project, name, readme, commits, files, content_signature))
+
+    if contexts:
+        run_batch(projects, pending, contexts, args, phase_cache)
+        report_usage(phase_cache)
+        if not args.dry_run:
+            phase_cache.save()
+        return
+
+    # Run the Councils concurrently; the rate limiters pace the provider calls
+    def convene(item):
+        _, name, readme, commits, files, content_signature = item
+        return run_council(name, readme, commits, files, job_context, provider=args.provider,
+                           phase_cache=phase_cache, signature=content_signature)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        results = list(pool.map(convene, pending))
+
+    for (project, name, _, _, _, content_signature), result in zip(pending, results):
         if result:
-            project['ai_summary'] = result.get('ai_summary') or result.get('summary')
-            project['ai_tags'] = result.get('ai_tags') or result.get('tags')
-            project['complexity_score'] = result.get('complexity_score') or result.get('complexity')
+            apply_result(project, result)
             
             if not job_context:
                 cache[name] = {
@@ -392,22 +721,20 @@ def main():
                 updated_count += 1
             
             projects_modified = True
-            projects_modified = True
-            print("  ⏳ Cooling down for 30s (Rate Limit Safety)...")
-            time.sleep(30)
+
+    report_usage(phase_cache)
     
     # Save Updates
     if not args.dry_run and projects_modified:
-        print(f"\n💾 Saving updates to {output_path}...")
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-        
-        with open(output_path, 'w') as f:
-            json.dump(projects, f, indent=2)
+        save_projects(output_path, projects)
             
     if not args.dry_run and updated_count > 0:
         print(f"💾 Saving {updated_count} new entries to cache...")
         with open(cache_path, 'w') as f:
             json.dump(cache, f, indent=2)
 
+    if not args.dry_run:
+        phase_cache.save()
+
 if __name__ == '__main__':
     main()
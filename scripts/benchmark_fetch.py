@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Fetch Benchmark
+---------------
+End-to-end benchmark of `fetch/fetch_contributions.py` against the local
+GitHub stub (scripts/github_stub_server.py).
+
+The stub runs in-process (synthetic account, --fixture or --replay of recorded
+responses, optional --latency); the fetcher runs as a subprocess once per
+scenario and repeat, writing into a temporary directory so the pages are never
+touched. Each scenario reports wall time, request count, response bytes and
+peak RSS of the fetcher process.
+
+With --baseline the results are compared with an earlier --json report and the
+script exits with status 1 if any metric got worse by more than --tolerance.
+
+Usage:
+    python scripts/benchmark_fetch.py [--repos 30] [--commits 250] [--latency 20] [--repeat 3]
+    python scripts/benchmark_fetch.py --scenario rest --scenario graphql --json bench.json
+    python scripts/benchmark_fetch.py --baseline bench.json --tolerance 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from github_stub_server import build_stub, serve
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FETCH_SCRIPT = os.path.join(ROOT_DIR, 'fetch', 'fetch_contributions.py')
+METRICS = ('wall_s', 'requests', 'bytes', 'peak_rss_mb')
+
+# Scenario name -> (fetcher arguments, prime the response cache first)
+SCENARIOS = {
+    'rest-serial': (['--engine', 'rest', '--workers', '1', '--no-cache'], False),
+    'rest': (['--engine', 'rest', '--no-cache'], False),
+    'rest-warm-cache': (['--engine', 'rest'], True),
+    'graphql': (['--engine', 'graphql', '--no-cache'], False),
+}
+
+
+def peak_rss_mb(usage):
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_fetch(args, env, log_path):
+    """Run the fetcher once; returns (exit code, wall seconds, peak RSS in MB)."""
+    with open(log_path, 'w') as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, FETCH_SCRIPT] + args, env=env, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 gives this child's own rusage (RUSAGE_CHILDREN would be the max over all runs)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, wall, peak_rss_mb(usage)
+
+
+def run_scenario(name, stub, base_url, workdir, repeat):
+    """Run one scenario `repeat` times; returns its metrics (median wall, max RSS)."""
+    fetch_args, prime = SCENARIOS[name]
+    out_dir = os.path.join(workdir, name)
+    env = dict(os.environ, GITHUB_API_URL=base_url, GITHUB_TOKEN='stub',
+               GITHUB_CACHE_PATH=os.path.join(out_dir, 'responses.sqlite3'))
+    args = fetch_args + ['--full', '--profile', 'fetch', '--output-root', out_dir]
+    log_path = os.path.join(workdir, f'{name}.log')
+
+    if prime:
+        run_fetch(args, env, log_path)
+
+    walls, rss = [], []
+    for _ in range(repeat):
+        before = stub.stats()
+        code, wall, peak = run_fetch(args, env, log_path)
+        after = stub.stats()
+        if code != 0:
+            with open(log_path, 'r') as f:
+                raise RuntimeError(f'{name} failed with exit code {code}:\n{f.read()[-2000:]}')
+        walls.append(wall)
+        rss.append(peak)
+
+    return {
+        'wall_s': round(statistics.median(walls), 3),
+        'requests': after['requests'] - before['requests'],
+        'bytes': after['bytes'] - before['bytes'],
+        'peak_rss_mb': round(max(rss), 1),
+        'runs': repeat
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return the (scenario, metric, old, new) tuples that regressed beyond `tolerance`."""
+    regressions = []
+    for name, metrics in results.items():
+        old = baseline.get('scenarios', {}).get(name)
+        if not old:
+            continue
+        for metric in METRICS:
+            if old.get(metric) and metrics[metric] > old[metric] * (1 + tolerance):
+                regressions.append((name, metric, old[metric], metrics[metric]))
+    return regressions
+
+
+def print_table(results):
+    print(f"{'scenario':18} {'wall (s)':>9} {'requests':>9} {'KB':>10} {'peak RSS (MB)':>14}")
+    for name, m in results.items():
+        print(f"{name:18} {m['wall_s']:9.3f} {m['requests']:9} {m['bytes'] / 1024:10.1f} {m['peak_rss_mb']:14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the contribution fetcher against the local GitHub stub")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per scenario (wall time is the median)")
+    parser.add_argument('--fixture', help="Serve this dataset JSON instead of synthetic data")
+    parser.add_argument('--replay', help="Serve REST responses recorded in this responses.sqlite3")
+    parser.add_argument('--repos', type=int, default=30, help="Synthetic: number of repos")
+    parser.add_argument('--commits', type=int, default=250, help="Synthetic: max commits per repo")
+    parser.add_argument('--activity', type=int, default=20, help="Synthetic: max PRs/issues per repo")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic: random seed")
+    parser.add_argument('--page-size', type=int, default=100, help="Max items per page")
+    parser.add_argument('--latency', type=float, default=0, help="Milliseconds added to every stub response")
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--baseline', help="Compare with an earlier --json report; exit 1 on regression")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown vs. the baseline (default: 0.2 = 20%%)")
+    parser.add_argument('--keep', action='store_true', help="Keep the temporary output directory (logs, data.json)")
+    args = parser.parse_args()
+
+    stub = build_stub(args)
+    server = serve(stub, port=0)
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    workdir = tempfile.mkdtemp(prefix='fetch-bench-')
+    source = f'{len(stub.replay)} recorded responses' if stub.replay else f'{len(stub.repos)} repos'
+    print(f"Benchmarking against {source} at {base_url} (latency {args.latency:g} ms, page size {args.page_size})")
+    print()
+
+    results = {}
+    try:
+        for name in args.scenario or SCENARIOS:
+            results[name] = run_scenario(name, stub, base_url, workdir, args.repeat)
+    finally:
+        server.shutdown()
+        if args.keep:
+            print(f'Outputs kept in {workdir}')
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_table(results)
+
+    report = {
+        'config': {k: getattr(args, k) for k in ('repos', 'commits', 'activity', 'seed', 'page_size', 'latency',
+                                                 'fixture', 'replay', 'repeat')},
+        'scenarios': results
+    }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'\nSaved to {args.json}')
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print()
+        for name, metric, old, new in regressions:
+            print(f'REGRESSION {name} {metric}: {old} -> {new}')
+        if regressions:
+            sys.exit(1)
+        print(f'No regressions beyond {args.tolerance:.0%} of {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Contribution Aggregator
+-----------------------
+Single-pass aggregation engine behind `data.json`.
+
+Events are stored as compact columns (day ordinal, interned repo / language /
+type ids) and every total - monthly counts, per-month language counts, unique
+repos per month and overall - is updated as each event is added. Strings are
+only produced once, in `to_result()`, with one date format per distinct day.
+
+`to_result()` also emits a `calendar` block the pages can render directly,
+without walking the per-event `daily` list (which `daily=False` leaves out):
+
+    {"start": "2025-01-02", "counts": [3, 0, 1, ...],      # one per day from start
+     "weekStart": "2024-12-29", "weeks": [4, 9, ...],      # Sunday-based weeks
+     "days": {"0": {"repos": {...}, "languages": {...}}, ...},   # days with events
+     "repos": {"my-repo": 120, ...},
+     "longestStreak": {"days": 6, "start": "2025-03-02", "end": "2025-03-07"}}
+
+Per-language totals are the top-level `languages`.
+
+Usage:
+    agg = ContributionAggregator()
+    agg.add(day_ordinal('2025-03-04T10:00:00Z'), 'my-repo', 'Python', 'commit')
+    agg.add_record({'date': 'Tue Mar 04 2025', 'repo': ..., 'language': ..., 'type': ...})
+    result = agg.to_result()          # or to_result(daily=False)
+"""
+
+from array import array
+from datetime import date, datetime
+from functools import lru_cache
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+DISPLAY_FORMAT = '%a %b %d %Y'   # Matches JavaScript's Date.toDateString()
+
+
+def day_ordinal(timestamp):
+    """'2025-03-04T10:00:00Z' (or '2025-03-04') -> proleptic Gregorian ordinal."""
+    return _date_ordinal(timestamp[:10])
+
+
+@lru_cache(maxsize=None)
+def _date_ordinal(day):
+    # Keyed on the date alone: full timestamps are nearly all distinct
+    return date.fromisoformat(day).toordinal()
+
+
+@lru_cache(maxsize=None)
+def display_day_ordinal(display_date):
+    """'Tue Mar 04 2025' (the data.json format) -> ordinal."""
+    return datetime.strptime(display_date, DISPLAY_FORMAT).toordinal()
+
+
+@lru_cache(maxsize=None)
+def format_day(ordinal):
+    """Ordinal -> 'Tue Mar 04 2025'."""
+    return date.fromordinal(ordinal).strftime(DISPLAY_FORMAT)
+
+
+@lru_cache(maxsize=None)
+def _year_month(ordinal):
+    d = date.fromordinal(ordinal)
+    return d.year, d.month - 1
+
+
+class StringTable:
+    """Interns strings to small integer ids, in first-seen order."""
+
+    def __init__(self):
+        self.ids = {}
+        self.values = []
+
+    def intern(self, value):
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ContributionAggregator:
+    """Accumulates contribution events and their totals in one pass."""
+
+    def __init__(self):
+        self.repos = StringTable()
+        self.languages = StringTable()
+        self.types = StringTable()
+
+        # Event columns, in insertion order (the order of `daily` in the output)
+        self.days = array('l')
+        self.repo_ids = array('l')
+        self.lang_ids = array('l')
+        self.type_ids = array('l')
+
+        # Running totals
+        self.language_totals = []       # lang id -> count
+        self.month_langs = {}           # (year, month) -> {lang id: count}, first-seen order
+        self.month_repos = {}           # (year, month) -> {repo ids}
+
+    def __len__(self):
+        return len(self.days)
+
+    def add(self, ordinal, repo, language, event_type='commit'):
+        """Add one event for day `ordinal`."""
+        repo_id = self.repos.intern(repo)
+        lang_id = self.languages.intern(language)
+        if lang_id == len(self.language_totals):
+            self.language_totals.append(0)
+
+        self.days.append(ordinal)
+        self.repo_ids.append(repo_id)
+        self.lang_ids.append(lang_id)
+        self.type_ids.append(self.types.intern(event_type))
+
+        self.language_totals[lang_id] += 1
+        key = _year_month(ordinal)
+        month = self.month_langs.get(key)
+        if month is None:
+            month = self.month_langs[key] = {}
+            self.month_repos[key] = set()
+        month[lang_id] = month.get(lang_id, 0) + 1
+        self.month_repos[key].add(repo_id)
+
+    def add_record(self, record):
+        """Add an event from an existing data.json `daily` record."""
+        self.add(display_day_ordinal(record['date']), record['repo'], record['language'], record.get('type', 'commit'))
+
+    def add_records(self, records):
+        for record in records:
+            self.add_record(record)
+
+    def years(self):
+        """Calendar years that have at least one event, ascending."""
+        return sorted({year for year, _ in self.month_langs})
+
+    def for_year(self, year):
+        """A new aggregator holding only this year's events (same relative order)."""
+        sub = ContributionAggregator()
+        repos, languages, types = self.repos.values, self.languages.values, self.types.values
+        for day, r, l, t in zip(self.days, self.repo_ids, self.lang_ids, self.type_ids):
+            if _year_month(day)[0] == year:
+                sub.add(day, repos[r], languages[l], types[t])
+        return sub
+
+    def calendar(self):
+        """Build the pre-aggregated calendar block (see the module docstring)."""
+        repos, languages = self.repos.values, self.languages.values
+        if not self.days:
+            return {'start': None, 'counts': [], 'weekStart': None, 'weeks': [], 'days': {}, 'repos': {},
+                    'longestStreak': {'days': 0, 'start': None, 'end': None}}
+
+        start, end = min(self.days), max(self.days)
+        counts = [0] * (end - start + 1)
+        details = {}
+        repo_totals = {}
+        for day, r, l in zip(self.days, self.repo_ids, self.lang_ids):
+            offset = day - start
+            counts[offset] += 1
+            detail = details.get(offset)
+            if detail is None:
+                detail = details[offset] = ({}, {})
+            detail[0][repos[r]] = detail[0].get(repos[r], 0) + 1
+            detail[1][languages[l]] = detail[1].get(languages[l], 0) + 1
+            repo_totals[repos[r]] = repo_totals.get(repos[r], 0) + 1
+
+        # Weeks run Sunday to Saturday, like the page calendars
+        week_start = start - (start % 7)
+        weeks = [0] * ((end - week_start) // 7 + 1)
+        for offset, count in enumerate(counts):
+            weeks[(start + offset - week_start) // 7] += count
+
+        best, run = (0, None), 0
+        for offset, count in enumerate(counts):
+            run = run + 1 if count else 0
+            if run > best[0]:
+                best = (run, offset)
+        streak_days, streak_end = best
+
+        return {
+            'start': date.fromordinal(start).isoformat(),
+            'counts': counts,
+            'weekStart': date.fromordinal(week_start).isoformat(),
+            'weeks': weeks,
+            'days': {str(offset): {'repos': r, 'languages': l} for offset, (r, l) in sorted(details.items())},
+            'repos': dict(sorted(repo_totals.items(), key=lambda x: -x[1])),
+            'longestStreak': {
+                'days': streak_days,
+                'start': date.fromordinal(start + streak_end - streak_days + 1).isoformat(),
+                'end': date.fromordinal(start + streak_end).isoformat()
+            }
+        }
+
+    def to_result(self, daily=True):
+        """Build the data.json structure (monthly, totals, daily, languages, calendar).
+
+        With `daily=False` the per-event list is left out; pages render from `calendar`.
+        """
+        languages = self.languages.values
+        repos = self.repos.values
+        types = self.types.values
+        language_totals = {languages[i]: count for i, count in enumerate(self.language_totals)}
+
+        # Months are calendar months; events from different years share a slot
+        month_counts = [{} for _ in MONTH_NAMES]
+        month_repo_ids = [set() for _ in MONTH_NAMES]
+        for (_, month), counts in sorted(self.month_langs.items()):
+            for lang_id, count in counts.items():
+                month_counts[month][lang_id] = month_counts[month].get(lang_id, 0) + count
+            month_repo_ids[month] |= self.month_repos[(_, month)]
+
+        monthly = []
+        for i, name in enumerate(MONTH_NAMES):
+            monthly.append({
+                'name': name,
+                'count': sum(month_counts[i].values()),
+                'uniqueRepos': len(month_repo_ids[i]),
+                'languages': dict(language_totals),
+                'topLangCounts': {languages[l]: c for l, c in month_counts[i].items()}
+            })
+
+        result = {
+            'monthly': monthly,
+            'totalCommits': len(self.days),
+            'uniqueReposTotal': len(repos)
+        }
+        if daily:
+            result['daily'] = [
+                {'date': format_day(day), 'repo': repos[r], 'language': languages[l], 'type': types[t]}
+                for day, r, l, t in zip(self.days, self.repo_ids, self.lang_ids, self.type_ids)
+            ]
+        result['languages'] = language_totals
+        result['calendar'] = self.calendar()
+        return result
@@ -0,0 +1,828 @@
+#!/usr/bin/env python3
+"""
+Contribution Fetch Core
+-----------------------
+Fetch ALL GitHub contributions (including private repos) once and write the
+`data.json` of every page profile from that single in-memory dataset.
+
+A profile (see PROFILES) declares which repos count (affiliation), the window
+(since / until) and which PR/issue activity is included. One run fetches the
+union - every affiliation, the widest window, activity only if some profile
+wants it - and each profile then filters the events it needs and attributes
+languages for them (see scripts/language_attribution.py).
+
+Uses the Languages API to get the full language breakdown per repository.
+Per-repo API calls run on a bounded thread pool (see --workers); results are
+consumed in repo-list order so the output is identical to a serial run.
+
+Runs are incremental: fetch/sync_state.json keeps a per-repo high-water mark
+(newest commit and newest PR/issue seen), so only newer items are fetched and
+merged into each profile's existing daily records. The state is only reused by
+a run over the same profiles and windows; anything else (or --full) rebuilds.
+A run over a subset of the profiles (e.g. scopely/fetch_contributions.py) keeps
+its own state, fetch/sync_state-<profiles>.json, and leaves the full run's alone.
+A repo whose paging stopped early (or every repo's PRs/issues, when the search
+did) keeps its old mark and its new events are left out, so the next run
+fetches them again from that mark instead of skipping what was missed.
+The state is kept out of git (it names private repos; CI keeps it in its
+cache) and records a fingerprint of the data files it was written with, so a
+state restored next to different data (a local run's commit, a lost cache
+save) triggers a full run instead of double-counting.
+
+Before fetching, the REST engine plans each repo's calls from the repo list's
+`pushed_at` and the state (see plan_fetch): repos not pushed since the window
+started, or since the last sync, skip the commits scan, and a repo's stored
+language breakdown is reused until it is pushed again. Languages are only
+requested for repos that have events to attribute.
+
+PRs and issues come from the Search API (`author:` + `created:` filtered
+server-side, a few requests for the whole account); `--activity-source repo`
+scans each repo's /issues instead, which filters on *updated* time and so
+downloads (and discards) older items that were merely touched in the window.
+
+`--engine graphql` swaps the per-repo REST calls for batched GraphQL queries
+(see scripts/github_graphql.py); the output is the same.
+
+`--offline` runs entirely from the stored REST responses (see
+scripts/github_cache.py), e.g. to iterate on aggregation without the network.
+The token must be the one the responses were stored with.
+
+With `--shard-by-year` each profile writes one data-YYYY.json per calendar
+year plus data-manifest.json instead of data.json. Years that are over and
+fully inside a profile's window are marked final: they are never refetched or
+rewritten, even with --full.
+
+Every data.json / shard carries a pre-aggregated `calendar` block (per-day
+and per-week counts, per-day repo / language breakdowns, repo totals, longest
+streak) the pages render from directly. `--no-daily` leaves the raw per-event
+`daily` list out; the next run then can't be incremental and rebuilds.
+
+Finished REST work (the activity search, each repo's languages / commits /
+activity) is checkpointed to fetch/fetch_journal.jsonl as it completes. If
+the run dies partway, `--resume` with the same options continues from there
+instead of fetching it all again; the journal is removed once a run finishes.
+
+Every request that goes over the wire is traced (scripts/github_trace.py);
+the run ends by writing fetch/fetch_metrics.json (see --metrics) with
+per-endpoint latency, the slowest repos, errors and truncated paginations.
+
+Usage (from the page wrappers, e.g. fetch/fetch_contributions.py):
+    main()                        # every profile
+    main(profiles=['ambience'])   # default to one profile
+"""
+import os
+import json
+import hashlib
+import argparse
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+from github_cache import ResponseCache
+from github_ratelimit import RateLimitScheduler
+from github_trace import RequestTracer
+from github_pagination import iter_pages
+from github_graphql import GraphQLEngine, API_URL
+from contrib_journal import FetchJournal
+from contrib_aggregate import ContributionAggregator, day_ordinal
+from language_attribution import LanguageDistribution, MODES, DEFAULT_MODE
+from contrib_format import (FORMATS, MANIFEST_NAME, load_result, write_result, load_manifest, final_years,
+                            load_shards, write_shards)
+
+load_dotenv()
+TOKEN = os.getenv('GITHUB_TOKEN')
+USERNAME = 'akashagl92'
+TRACER = RequestTracer()
+SCHEDULER = RateLimitScheduler(session=TRACER)
+CACHE = ResponseCache(transport=SCHEDULER.get)
+DEFAULT_WORKERS = 8
+DEFAULT_SINCE = '2025-01-01T00:00:00Z'
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATE_FILE = os.path.join('fetch', 'sync_state.json')   # relative to the output root
+METRICS_FILE = os.path.join('fetch', 'fetch_metrics.json')
+JOURNAL_FILE = os.path.join('fetch', 'fetch_journal.jsonl')
+SEARCH_RESULT_CAP = 1000   # the Search API won't page past this many results
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+AFFILIATIONS = ('owner', 'collaborator', 'organization_member')
+
+# Page profiles: output directory (relative to the repo root), which repos
+# count, the window (YYYY-MM-DD, inclusive; until None = open-ended) and
+# which PR/issue activity types are included besides commits.
+PROFILES = {
+    'fetch': {
+        'output': 'fetch',
+        'affiliation': ['owner', 'collaborator', 'organization_member'],
+        'since': '2025-01-01',
+        'until': None,
+        'activity': ['pr', 'issue']
+    },
+    'scopely': {
+        'output': 'scopely',
+        'affiliation': ['owner', 'collaborator', 'organization_member'],
+        'since': '2025-01-01',
+        'until': None,
+        'activity': ['pr', 'issue']
+    },
+    # The page has always published fetch/'s data (the workflow copied it);
+    # its old owner-only, 2025, commits-only script was never run by CI.
+    'ambience': {
+        'output': 'ambience',
+        'affiliation': ['owner', 'collaborator', 'organization_member'],
+        'since': '2025-01-01',
+        'until': None,
+        'activity': ['pr', 'issue']
+    }
+}
+
+def affiliation_of(repo, login=USERNAME):
+    """Tag a repo as owner / organization_member / collaborator from its owner."""
+    owner = repo.get('owner') or repo['full_name'].split('/', 1)[0]
+    if owner.lower() == login.lower():
+        return 'owner'
+    return 'organization_member' if repo.get('owner_type') == 'Organization' else 'collaborator'
+
+def get_repo_languages(repo_full_name, headers):
+    """Get the language breakdown for a repository (bytes per language)."""
+    response = CACHE.get(
+        f'{API_URL}/repos/{repo_full_name}/languages',
+        headers=headers
+    )
+    if response.status_code == 200:
+        return response.json()  # {'Python': 50000, 'HTML': 5000, ...}
+    return {}
+
+def iter_commits(repo_full_name, headers, since=DEFAULT_SINCE, until=None):
+    """Yield the user's commits in a repo since `since` (and up to `until`), one page at a time.
+
+    Only the fields the aggregation needs are kept from each (multi-KB) commit.
+    """
+    params = {'since': since, 'author': USERNAME, 'per_page': 100}
+    if until:
+        params['until'] = until
+    for _, commits in iter_pages(
+        CACHE.get,
+        f'{API_URL}/repos/{repo_full_name}/commits',
+        headers=headers,
+        params=params,
+        on_truncated=TRACER.truncated
+    ):
+        for commit in commits:
+            yield {
+                'sha': commit['sha'],
+                'date': commit['commit']['author']['date'],
+                'committed_at': commit['commit']['committer']['date']
+            }
+
+def iter_user_activity(repo_full_name, headers, since=DEFAULT_SINCE):
+    """Yield PRs and Issues created by user since `since`."""
+    # Issues endpoint includes PRs; `pull_request` tells them apart
+    for _, items in iter_pages(
+        CACHE.get,
+        f'{API_URL}/repos/{repo_full_name}/issues',
+        headers=headers,
+        params={'creator': USERNAME, 'state': 'all', 'since': since, 'per_page': 100},
+        on_truncated=TRACER.truncated
+    ):
+        for item in items:
+            # API 'since' includes updates, we want creation
+            if item['created_at'] < since:
+                continue
+
+            yield {
+                'id': item['id'],
+                'type': 'pr' if 'pull_request' in item else 'issue',
+                'date': item['created_at'][:10],
+                'created_at': item['created_at'],
+                'repo': repo_full_name
+            }
+
+def iter_search_activity(headers, since=DEFAULT_SINCE, until=None, kind='pr'):
+    """Yield the user's PRs (kind 'pr') or issues created in [since, until] across all repos.
+
+    Uses the Search API, which filters on author and creation time server-side.
+    A window matching more than SEARCH_RESULT_CAP items is split in two and
+    each half searched on its own, newest half first.
+    """
+    created = f'{since}..{until}' if until else f'>={since}'
+    qualifier = 'is:pr' if kind == 'pr' else 'is:issue'
+    pages = iter_pages(
+        CACHE.get,
+        f'{API_URL}/search/issues',
+        headers=headers,
+        params={'q': f'author:{USERNAME} {qualifier} created:{created}', 'sort': 'created', 'order': 'desc',
+                'per_page': 100},
+        on_truncated=TRACER.truncated
+    )
+    for page, result in pages:
+        if page == 1 and result.get('total_count', 0) > SEARCH_RESULT_CAP:
+            start = datetime.strptime(since, TIMESTAMP_FORMAT)
+            end = datetime.strptime(until, TIMESTAMP_FORMAT) if until else datetime.now(timezone.utc).replace(tzinfo=None)
+            if end - start > timedelta(seconds=1):
+                pages.close()
+                middle = (start + (end - start) / 2).replace(microsecond=0)
+                yield from iter_search_activity(headers, (middle + timedelta(seconds=1)).strftime(TIMESTAMP_FORMAT),
+                                                until, kind)
+                yield from iter_search_activity(headers, since, middle.strftime(TIMESTAMP_FORMAT), kind)
+                return
+
+        for item in result.get('items', []):
+            yield {
+                'id': item['id'],
+                'type': 'pr' if 'pull_request' in item else 'issue',
+                'date': item['created_at'][:10],
+                'created_at': item['created_at'],
+                'repo': item['repository_url'].split('/repos/', 1)[-1]
+            }
+
+def search_user_activity(repos, headers, watermarks=None, since=DEFAULT_SINCE, until=None):
+    """Fetch the PR/issue activity of every repo in a few account-wide searches.
+
+    Returns {full_name (lowercase): [items, newest first]}. The search starts
+    at the oldest per-repo watermark; each repo then keeps only what is new to it.
+    """
+    watermarks = watermarks or {}
+    repo_since = {
+        repo['full_name'].lower(): (watermarks.get(repo['full_name']) or {}).get('activity_created_at', since)
+        for repo in repos
+    }
+    found = {name: [] for name in repo_since}
+    start = min(repo_since.values(), default=since)
+
+    for kind in ('pr', 'issue'):
+        for act in iter_search_activity(headers, start, until, kind):
+            name = act['repo'].lower()
+            # Contributions to repos outside the repo list don't count
+            if name in found and act['created_at'] >= repo_since[name]:
+                found[name].append(act)
+
+    for items in found.values():
+        items.sort(key=lambda a: a['created_at'], reverse=True)
+    return found
+
+def iter_repos(headers, affiliation=AFFILIATIONS):
+    """Yield all repositories for the given affiliations, projected to the fields we use."""
+    pages = iter_pages(
+        CACHE.get,
+        f'{API_URL}/user/repos',
+        headers=headers,
+        params={'per_page': 100, 'affiliation': ','.join(affiliation)},
+        on_truncated=TRACER.truncated
+    )
+    for _, repos in pages:
+        for repo in repos:
+            owner = repo.get('owner') or {}
+            yield {
+                'name': repo['name'],
+                'full_name': repo['full_name'],
+                'private': repo['private'],
+                'language': repo.get('language'),
+                'pushed_at': repo.get('pushed_at'),
+                'owner': owner.get('login'),
+                'owner_type': owner.get('type')
+            }
+
+def get_all_repos(headers, affiliation=AFFILIATIONS):
+    """Get all repositories as a list."""
+    repos = list(iter_repos(headers, affiliation))
+    if not repos:
+        print("Error fetching repos: none returned")
+    return repos
+
+def plan_fetch(repos, watermarks=None, since=DEFAULT_SINCE):
+    """Decide which calls each repo needs from the repo list metadata and the stored state.
+
+    Returns {full_name: {'commits': bool, 'languages': stored breakdown or None}}.
+    Commits are skipped for repos not pushed since the window started or since
+    the last sync (same `pushed_at`); a stored language breakdown is reused
+    until the repo is pushed again.
+    """
+    watermarks = watermarks or {}
+    plan = {}
+    for repo in repos:
+        watermark = watermarks.get(repo['full_name']) or {}
+        pushed_at = repo.get('pushed_at')
+        unchanged = bool(pushed_at) and watermark.get('pushed_at') == pushed_at
+        plan[repo['full_name']] = {
+            'commits': not pushed_at or (pushed_at >= since and not unchanged),
+            'languages': watermark.get('languages') if unchanged else None
+        }
+    return plan
+
+def print_plan(plan, activity_source=None):
+    """Print how many per-repo calls the plan makes and how many it avoids."""
+    total = len(plan)
+    scans = sum(1 for step in plan.values() if step['commits'])
+    reused = sum(1 for step in plan.values() if step['languages'])
+    issue_scans = total if activity_source == 'repo' else 0
+    print(f"Plan for {total} repos: {scans} commit scans ({total - scans} unchanged or not pushed in the window), "
+          f"{reused} language breakdowns reused" + (f", PRs/issues via {activity_source}" if activity_source else ''))
+    print(f"  up to {scans + issue_scans + total - reused} per-repo calls (+ pagination), {total - scans + reused} avoided")
+
+def fetch_repo(repo, headers, watermark=None, since=DEFAULT_SINCE, until=None, activity=True, step=None):
+    """Fetch commits, (optionally) PR/issue activity and languages for a single repo.
+
+    With a `watermark` only items from the last sync onwards are requested.
+    `activity` is True to scan the repo's issues, or the items already found
+    by search_user_activity. `step` is the repo's entry from plan_fetch; the
+    language breakdown is only requested when there are events to attribute.
+    """
+    watermark = watermark or {}
+    step = step or {'commits': True, 'languages': None}
+    commits = []
+    if step['commits']:
+        commits = list(iter_commits(repo['full_name'], headers, watermark.get('commit_date', since), until))
+    other_activity = activity or []
+    if activity is True:
+        other_activity = list(iter_user_activity(repo['full_name'], headers, watermark.get('activity_created_at', since)))
+
+    repo_languages = step['languages'] or {}
+    if not step['languages'] and (commits or other_activity):
+        repo_languages = get_repo_languages(repo['full_name'], headers)
+    return repo, repo_languages, commits, other_activity
+
+def fetch_all_repos(repos, headers, workers=DEFAULT_WORKERS, watermarks=None, since=DEFAULT_SINCE, until=None,
+                    activity=True, activity_source='search', plan=None, journal=None):
+    """Fetch every repo, spreading the work over `workers` threads.
+
+    Results come back in the same order as `repos` regardless of which
+    request finishes first, so downstream processing stays deterministic.
+    PR/issue activity comes from account-wide searches (`activity_source`
+    'search', run first) or from one /issues scan per repo ('repo').
+
+    With a `journal` every finished search / repo is checkpointed (unless its
+    pagination stopped early) and work already in it is not fetched again.
+    """
+    watermarks = watermarks or {}
+    plan = plan or plan_fetch(repos, watermarks, since)
+    found = None
+    if activity and activity_source == 'search' and repos:
+        found = journal.get('search') if journal else None
+        if found is None:
+            found = search_user_activity(repos, headers, watermarks, since, until)
+            if journal and not TRACER.was_truncated(endpoint='GET /search/issues'):
+                journal.record('search', found)
+
+    def task(repo):
+        key = f"repo:{repo['full_name']}"
+        done = journal.get(key) if journal else None
+        if done is not None:
+            return repo, done['languages'], done['commits'], done['activity']
+
+        repo_activity = found[repo['full_name'].lower()] if found is not None else activity
+        result = fetch_repo(repo, headers, watermarks.get(repo['full_name']), since, until, repo_activity,
+                            plan[repo['full_name']])
+        if journal and not TRACER.was_truncated(repo=repo['full_name']):
+            _, repo_languages, commits, other_activity = result
+            journal.record(key, {'languages': repo_languages, 'commits': commits, 'activity': other_activity})
+        return result
+
+    if workers <= 1:
+        return [task(repo) for repo in repos]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, repos))
+
+def drop_seen(results, watermarks):
+    """Drop commits / PRs / issues already counted by a previous sync.
+
+    The `since` bound is inclusive, so items sitting exactly on the watermark
+    come back again and are filtered out here by SHA / id.
+    """
+    for repo, repo_languages, commits, other_activity in results:
+        watermark = watermarks.get(repo['full_name']) or {}
+        seen_shas = set(watermark.get('commit_shas', []))
+        seen_ids = set(watermark.get('activity_ids', []))
+        yield (
+            repo,
+            repo_languages,
+            [c for c in commits if c['sha'] not in seen_shas],
+            [a for a in other_activity if a['id'] not in seen_ids]
+        )
+
+def advance_watermark(watermark, commits, activity):
+    """Move a repo's high-water mark past the newest commit and PR/issue just fetched.
+
+    Commits are tracked by committer date (what the API's `since` filters on);
+    the SHAs / ids sitting exactly on the mark are kept so the inclusive
+    `since` bound doesn't count them twice next run.
+    """
+    watermark = dict(watermark or {})
+
+    for commit in commits:
+        date = commit['committed_at']
+        if date > watermark.get('commit_date', ''):
+            watermark['commit_date'] = date
+            watermark['commit_shas'] = [commit['sha']]
+        elif date == watermark['commit_date'] and commit['sha'] not in watermark['commit_shas']:
+            watermark['commit_shas'].append(commit['sha'])
+
+    for act in activity:
+        created_at = act['created_at']
+        if created_at > watermark.get('activity_created_at', ''):
+            watermark['activity_created_at'] = created_at
+            watermark['activity_ids'] = [act['id']]
+        elif created_at == watermark['activity_created_at'] and act['id'] not in watermark['activity_ids']:
+            watermark['activity_ids'].append(act['id'])
+
+    return watermark
+
+def profile_set_path(filename, profiles, root=ROOT_DIR):
+    """`filename` under `root` for a run over every profile, `<stem>-<a>+<b><ext>` for any other set.
+
+    Each profile set keeps its own sync state and journal, so a single page's
+    run doesn't replace the scheduled run's (which would then start over).
+    """
+    if set(profiles) == set(PROFILES):
+        return os.path.join(root, filename)
+    stem, ext = os.path.splitext(filename)
+    return os.path.join(root, f"{stem}-{'+'.join(sorted(profiles))}{ext}")
+
+def load_state(since, profiles, data, root=ROOT_DIR):
+    """Load the per-repo watermarks, or None when they don't match this run.
+
+    `profiles` maps profile name -> effective profile and `data` profile name
+    -> fingerprint of its data files; the state is only reused by a run over
+    exactly the same profiles and windows, on the data it was saved with.
+    """
+    try:
+        with open(profile_set_path(STATE_FILE, profiles, root), 'r') as f:
+            state = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    # A different window or profile set means the stored history doesn't match; start over
+    if state.get('since') != since or state.get('profiles') != profiles:
+        return None
+    # The data files changed since (or without) this state; their events can't be told apart from new ones
+    if state.get('data') != data:
+        return None
+    return state.get('repos', {})
+
+def save_state(watermarks, since, profiles, data, root=ROOT_DIR):
+    """Persist per-repo watermarks (and the data fingerprints) for the next incremental run."""
+    path = profile_set_path(STATE_FILE, profiles, root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'since': since, 'profiles': profiles, 'data': data, 'repos': watermarks}, f, indent=2, sort_keys=True)
+
+def window_label(since, until=None):
+    """'2025-01-01', None -> '2025+'; otherwise '<since> to <until>'."""
+    if until:
+        return f'{since} to {until}'
+    return f'{since[:4]}+' if since.endswith('-01-01') else f'{since}+'
+
+def is_final_year(year, since, until, current_year):
+    """A year is final once it is over and the window covers all of it."""
+    return (year < current_year and since <= f'{year}-01-01T00:00:00Z'
+            and (until is None or until >= f'{year}-12-31T23:59:59Z'))
+
+class ProfileOutput:
+    """One page profile: filters the shared events, aggregates and writes its data.json."""
+
+    def __init__(self, name, profile, shard_by_year=False, root=ROOT_DIR):
+        self.name = name
+        self.profile = profile
+        self.output_dir = os.path.join(root, profile['output'])
+        self.output_path = os.path.join(self.output_dir, 'data.json')
+        self.since = f"{profile['since']}T00:00:00Z"
+        self.until = f"{profile['until']}T23:59:59Z" if profile['until'] else None
+        self.activity = set(profile['activity'])
+        self.label = window_label(profile['since'], profile['until'])
+
+        # Final year shards are never refetched, not even with --full
+        self.shard_by_year = shard_by_year
+        self.manifest = load_manifest(self.output_dir) if shard_by_year else None
+        self.sealed = final_years(self.manifest)
+        self.fetch_since = self.since
+        if self.sealed:
+            self.fetch_since = max(self.since, f'{max(self.sealed) + 1}-01-01T00:00:00Z')
+            if not self.done:
+                self.label = window_label(self.fetch_since[:10], profile['until'])
+
+        self.aggregator = ContributionAggregator()
+        self.previous_events = {}
+        self.new_count = 0
+
+    @property
+    def done(self):
+        """True when every year of the window is already in a final shard."""
+        return self.until is not None and self.fetch_since > self.until
+
+    def wants(self, repo):
+        return repo['affiliation'] in self.profile['affiliation']
+
+    def load_previous(self):
+        """Load the previous daily records, grouped by repo; False if they can't be read.
+
+        `previous_events` maps repo name -> (commit records, PR/issue records).
+        With a shard manifest the records come from the non-final year shards.
+        """
+        try:
+            if self.manifest:
+                open_years = [y for y in self.manifest['years'] if y not in self.sealed]
+                shards = load_shards(self.output_dir, open_years)
+                daily = [record for shard in shards for record in shard['daily']]
+            else:
+                daily = load_result(self.output_path)['daily']
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return False
+
+        for record in daily:
+            commit_records, activity_records = self.previous_events.setdefault(record['repo'], ([], []))
+            if record.get('type', 'commit') == 'commit':
+                commit_records.append(record)
+            else:
+                activity_records.append(record)
+        return True
+
+    def fingerprint(self):
+        """SHA-1 over the data files this profile wrote (manifest + shards, or data.json); None if one is missing."""
+        files = [os.path.basename(self.output_path)]
+        if self.shard_by_year:
+            manifest = load_manifest(self.output_dir)
+            if manifest is None:
+                return None
+            files = [MANIFEST_NAME] + sorted(shard['file'] for shard in manifest.get('shards', {}).values())
+
+        digest = hashlib.sha1()
+        for name in files:
+            try:
+                with open(os.path.join(self.output_dir, name), 'rb') as f:
+                    digest.update(name.encode('utf-8') + b'\0' + f.read())
+            except FileNotFoundError:
+                return None
+        return digest.hexdigest()
+
+    def clip(self, commits, other_activity):
+        """Keep this profile's events: inside its window (by day) and of its activity types.
+
+        The lower bound only applies when final year shards exist, so their
+        events are never counted twice; otherwise it is the API's own `since`.
+        """
+        low = self.fetch_since[:10] if self.sealed else ''
+        high = self.until[:10] if self.until else '9999'
+        return (
+            [c for c in commits if low <= c['date'][:10] <= high],
+            [a for a in other_activity if a['type'] in self.activity and low <= a['date'][:10] <= high]
+        )
+
+    def add_repo(self, repo, repo_languages, commits, other_activity, language_mode=DEFAULT_MODE):
+        """Add a repo's new events (newest first, like a full fetch) ahead of its previous ones."""
+        name = repo['name']
+        commits, other_activity = self.clip(commits, other_activity)
+        count = len(commits) + len(other_activity)
+        self.new_count += count
+
+        # Attribute languages for the repo's commits, then PRs/issues, in one batch.
+        # GitHub generally attributes PRs to languages, so they count
+        # towards the language totals like commits do.
+        if not count:
+            langs = []
+        elif repo_languages:
+            keys = [f"{repo['full_name']}:{c['sha']}" for c in commits]
+            keys += [f"{repo['full_name']}:{a['type']}:{a['id']}" for a in other_activity]
+            langs = LanguageDistribution(repo_languages).allocate(mode=language_mode, keys=keys)
+        else:
+            langs = [repo.get('language') or 'Other'] * count
+
+        old_commits, old_activity = self.previous_events.pop(name, ([], []))
+        for commit, lang in zip(commits, langs):
+            self.aggregator.add(day_ordinal(commit['date']), name, lang, 'commit')
+        self.aggregator.add_records(old_commits)
+        for act, lang in zip(other_activity, langs[len(commits):]):
+            self.aggregator.add(day_ordinal(act['date']), name, lang, act['type'])
+        self.aggregator.add_records(old_activity)
+
+    def write(self, fmt='legacy', shard_by_year=False, daily=True, seal=True):
+        """Write data.json (or the year shards + manifest) and print the totals.
+
+        With `daily=False` the per-event list is left out (pages use `calendar`).
+        With `seal=False` (the run's paging stopped early somewhere) no year shard
+        is marked final, so a year that came out short is rewritten next run.
+        """
+        # Repos that dropped out of the repo list keep their history
+        for old_commits, old_activity in self.previous_events.values():
+            self.aggregator.add_records(old_commits + old_activity)
+        self.previous_events = {}
+
+        result = self.aggregator.to_result(daily)
+        language_commits = result['languages']
+        total_commits = result['totalCommits']
+        print(f'[{self.name}] Total commits in {self.label}: {total_commits}')
+        print('Language breakdown (distributed by repo composition):')
+        for lang, count in sorted(language_commits.items(), key=lambda x: -x[1]):
+            pct = (count / total_commits) * 100 if total_commits > 0 else 0
+            print(f'  {lang}: {count} ({pct:.1f}%)')
+
+        if shard_by_year:
+            current_year = datetime.now(timezone.utc).year
+            last_year = min(int(self.until[:4]), current_year) if self.until else current_year
+            years = sorted(set(range(int(self.fetch_since[:4]), last_year + 1)) | set(self.aggregator.years()))
+            final = {y for y in years if seal and is_final_year(y, self.since, self.until, current_year)}
+            manifest = write_shards(self.aggregator, self.output_dir, years, fmt, final, last_year, daily)
+            for year in manifest['years']:
+                shard = manifest['shards'][str(year)]
+                status = 'final' if shard['final'] else 'open'
+                print(f"Saved {os.path.join(self.output_dir, shard['file'])} ({shard['totalCommits']} commits, {status})")
+        else:
+            os.makedirs(self.output_dir, exist_ok=True)
+            write_result(result, self.output_path, fmt)
+            print(f'Saved to {self.output_path}')
+        print()
+
+def main(profiles=None):
+    parser = argparse.ArgumentParser(description="Fetch GitHub contributions into each page profile's data.json")
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES),
+                        help=f"Profile to build (repeatable; default: {', '.join(profiles or PROFILES)})")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of repos fetched concurrently (default: {DEFAULT_WORKERS}, 1 = serial)")
+    parser.add_argument('--no-cache', action='store_true', help="Don't use the on-disk HTTP cache (.cache/github)")
+    parser.add_argument('--offline', action='store_true',
+                        help="Replay stored responses only (REST engine); anything not stored is treated as unavailable")
+    parser.add_argument('--full', action='store_true',
+                        help="Ignore the sync state (fetch/sync_state*.json) and refetch the whole window")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted run (same options) from fetch/fetch_journal*.jsonl (REST engine)")
+    parser.add_argument('--engine', choices=['rest', 'graphql'], default='rest',
+                        help="API backend: per-repo REST calls or batched GraphQL queries")
+    parser.add_argument('--activity-source', choices=['search', 'repo'], default='search',
+                        help="REST engine: PRs/issues from a few account-wide searches, or one /issues scan per repo")
+    parser.add_argument('--language-mode', choices=MODES, default=DEFAULT_MODE,
+                        help="How commits are attributed to a repo's languages (seeded/apportion are deterministic; "
+                             "only seeded is stable across incremental syncs)")
+    parser.add_argument('--format', choices=FORMATS, default='legacy',
+                        help="data.json layout: legacy, or compact columnar (+ data.json.gz)")
+    parser.add_argument('--since', help="Override every profile's window start, YYYY-MM-DD")
+    parser.add_argument('--until', help="Override every profile's window end, YYYY-MM-DD inclusive")
+    parser.add_argument('--output-root', default=ROOT_DIR,
+                        help="Directory the profile outputs and fetch/sync_state*.json go under (default: the repo root)")
+    parser.add_argument('--metrics', help="Where to write the run metrics JSON (default: fetch/fetch_metrics.json)")
+    parser.add_argument('--shard-by-year', action='store_true',
+                        help="Write data-YYYY.json per year + data-manifest.json instead of data.json")
+    parser.add_argument('--no-daily', action='store_true',
+                        help="Leave the per-event daily list out (pages render from the calendar block); "
+                             "the next run is then a full one")
+    args = parser.parse_args()
+    CACHE.enabled = not args.no_cache
+    CACHE.offline = args.offline
+    SCHEDULER.max_concurrency = args.workers
+
+    if not TOKEN:
+        print("Error: GITHUB_TOKEN not found in .env file")
+        return
+    if args.offline and (args.no_cache or args.engine == 'graphql'):
+        print("Error: --offline replays the REST response cache; it can't be combined with --no-cache or --engine graphql")
+        return
+
+    headers = {'Authorization': f'token {TOKEN}'}
+
+    selected = {}
+    for name in args.profile or profiles or PROFILES:
+        profile = dict(PROFILES[name])
+        if args.since:
+            profile['since'] = args.since
+        if args.until:
+            profile['until'] = args.until
+        selected[name] = profile
+    outputs = [ProfileOutput(name, profile, args.shard_by_year, args.output_root) for name, profile in selected.items()]
+    for output in outputs:
+        if output.sealed:
+            print(f'[{output.name}] Final year shards (not refetched): {sorted(output.sealed)}')
+
+    # The union of what the profiles need is fetched once
+    active = [output for output in outputs if not output.done]
+    since = min(output.since for output in outputs)
+    fetch_since = min((output.fetch_since for output in active), default=since)
+    until = None if any(output.until is None for output in active) else max((o.until for o in active), default=None)
+    affiliation = [a for a in AFFILIATIONS if any(a in output.profile['affiliation'] for output in active)]
+    activity = any(output.activity for output in active)
+
+    data = {output.name: output.fingerprint() for output in outputs}
+    watermarks = None if args.full else load_state(since, selected, data, args.output_root)
+    if watermarks is not None and all(output.load_previous() for output in outputs):
+        mode = 'incremental'
+    else:
+        watermarks = {}
+        for output in outputs:
+            output.previous_events = {}
+        mode = 'full'
+
+    # Finished REST work is checkpointed; --resume picks up a journal left by the same run
+    journal = None
+    run = {
+        'profiles': selected, 'since': fetch_since, 'until': until, 'mode': mode,
+        'activity': activity and args.activity_source, 'shard_by_year': args.shard_by_year,
+        'state': hashlib.sha1(json.dumps(watermarks, sort_keys=True).encode('utf-8')).hexdigest()
+    }
+    if active and args.engine == 'rest':
+        journal = FetchJournal(profile_set_path(JOURNAL_FILE, selected, args.output_root))
+
+    # Get all repos the active profiles count
+    repos = []
+    resumed = journal.resume(run) if journal and args.resume else None
+    if resumed is not None:
+        repos = resumed
+        done = sum(1 for key in journal.entries if key.startswith('repo:'))
+        print(f"Resuming from {journal.path}: {done}/{len(repos)} repos already fetched")
+    elif active and args.engine == 'graphql':
+        engine = GraphQLEngine(TOKEN, transport=SCHEDULER.post)
+        repos = engine.get_all_repos()
+    elif active:
+        if args.resume:
+            print("No checkpoint journal from an identical run; starting from the beginning")
+        repos = get_all_repos(headers, affiliation)
+    for repo in repos:
+        repo['affiliation'] = affiliation_of(repo)
+    repos = [repo for repo in repos if any(output.wants(repo) for output in active)]
+    if args.offline and active and not repos:
+        print("Error: no stored repo list to replay; run once online first")
+        return
+    if journal:
+        journal.start(run, repos)
+
+    label = window_label(fetch_since[:10], until[:10] if until else None)
+    print(f"Fetching commits from {len(repos)} repos for {label} "
+          f"({mode}, {args.engine}, {args.workers} workers, profiles: {', '.join(selected)})...")
+    print()
+
+    if args.engine == 'graphql' and repos:
+        results = engine.fetch_all_repos(repos, fetch_since, args.workers, watermarks)
+    else:
+        plan = plan_fetch(repos, watermarks, fetch_since)
+        print_plan(plan, args.activity_source if activity else None)
+        print()
+        results = fetch_all_repos(repos, headers, args.workers, watermarks, fetch_since, until, activity,
+                                  args.activity_source, plan, journal)
+
+    new_count = 0
+    # An incomplete search leaves every repo's PR/issue mark where it was (no activity is added)
+    search_truncated = activity and args.activity_source == 'search' and TRACER.was_truncated(
+        endpoint='GET /search/issues')
+    if search_truncated:
+        print("Warning: the PR/issue search stopped early; new PRs/issues are left for the next run")
+
+    for repo, repo_languages, commits, other_activity in drop_seen(results, watermarks):
+        # Paging stopped early: keep the old mark (and pushed_at / languages) and
+        # leave what was fetched to the next run, which starts again from the mark
+        if TRACER.was_truncated(repo=repo['full_name']):
+            print(f"  Warning: {repo['full_name']} paging stopped early; its new events are left for the next run")
+            continue
+        if search_truncated:
+            other_activity = []
+
+        name = repo['name']
+        is_private = repo['private']
+        primary_lang = repo.get('language') or 'Other'
+
+        # Total count = Commits + PRs + Issues
+        count = len(commits) + len(other_activity)
+
+        if count > 0:
+            visibility = 'PRIVATE' if is_private else 'PUBLIC'
+
+            # Show language breakdown for this repo
+            if repo_languages:
+                total_bytes = sum(repo_languages.values())
+                lang_pcts = {k: f"{(v/total_bytes)*100:.1f}%" for k, v in repo_languages.items()}
+                print(f'  [{visibility:7}] {name:35} {count:3} commits')
+                print(f'            Languages: {lang_pcts}')
+            else:
+                print(f'  [{visibility:7}] {name:35} {count:3} commits ({primary_lang})')
+
+            new_count += count
+
+        for output in active:
+            if output.wants(repo):
+                output.add_repo(repo, repo_languages, commits, other_activity, args.language_mode)
+        watermark = advance_watermark(watermarks.get(repo['full_name']), commits, other_activity)
+        if repo.get('pushed_at'):
+            watermark['pushed_at'] = repo['pushed_at']
+            if repo_languages:
+                watermark['languages'] = repo_languages
+            else:
+                watermark.pop('languages', None)
+        watermarks[repo['full_name']] = watermark
+
+    print()
+    if mode == 'incremental':
+        print(f'New contributions since last sync: {new_count}')
+        print()
+    # A year is only sealed by a run that got every page it asked for
+    complete = not TRACER.was_truncated()
+    if args.shard_by_year and not complete:
+        print("Warning: paging stopped early; no year shard is marked final this run")
+    for output in outputs:
+        output.write(args.format, args.shard_by_year, not args.no_daily, complete)
+    save_state(watermarks, since, selected, {output.name: output.fingerprint() for output in outputs}, args.output_root)
+    if journal:
+        journal.finish()
+
+    CACHE.close()
+    print(SCHEDULER.summary())
+    metrics_path = args.metrics or os.path.join(args.output_root, METRICS_FILE)
+    metrics = TRACER.write(metrics_path, extra={'cache': CACHE.stats, 'rate_limits': SCHEDULER.state()})
+    print(f'{TRACER.summary(metrics)} (details in {metrics_path})')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Contribution Data Formats
+-------------------------
+Readers / writers for `data.json`.
+
+- legacy (default): the original pretty-printed structure; `daily` is a list of
+  {date, repo, language, type} dicts and every `monthly` entry repeats the
+  global `languages` map.
+- compact: a string table for repos / languages / types, the daily events as
+  integer-encoded columns (day offset from `start`, repo id, language id, type
+  id), no per-month copy of the language totals, minified JSON, plus a
+  precompressed `data.json.gz` sibling.
+
+Both carry the pre-aggregated `calendar` block (see contrib_aggregate.py);
+compact (version 2) stores its per-day breakdown with the same string table,
+as columns of day offsets and flat [id, count, id, count, ...] lists:
+
+    "days": {"offset": [0, 3], "repos": [[0, 2], [1, 1]], "languages": [[0, 1, 2, 1], [0, 1]]}
+
+Written with `daily=False` (fetch --no-daily) they have no `daily` events
+at all; pages render from `calendar`, but such a file can't seed an
+incremental run.
+
+Pages decode either format with `GithubService.decodeData()` in app.js;
+Python callers use `load_result()`.
+
+With year sharding, each calendar year is written to its own `data-YYYY.json`
+(in either format) and `data-manifest.json` indexes them:
+
+    {"years": [2025, 2026], "current": 2026, "format": "legacy",
+     "shards": {"2025": {"file": "data-2025.json", "final": true, "totalCommits": 231}, ...}}
+
+A shard is `final` once its year is over and fully covered by the fetch
+window; final shards are never rewritten or refetched.
+"""
+
+import os
+import gzip
+import json
+from datetime import date
+
+from contrib_aggregate import display_day_ordinal, format_day, StringTable
+
+FORMATS = ('legacy', 'compact')
+COMPACT_VERSION = 2   # 2: calendar.days uses the string table
+MANIFEST_NAME = 'data-manifest.json'
+
+
+def encode_counts(counts, table):
+    """{name: count} -> flat [id, count, ...] list against a StringTable."""
+    return [value for name, count in counts.items() for value in (table.intern(name), count)]
+
+
+def decode_counts(flat, names):
+    """Flat [id, count, ...] list -> {name: count}."""
+    return {names[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)}
+
+
+def encode_compact(result):
+    """Legacy result dict -> compact columnar dict."""
+    compact = {
+        'format': 'compact',
+        'version': COMPACT_VERSION,
+        'totalCommits': result['totalCommits'],
+        'uniqueReposTotal': result.get('uniqueReposTotal', 0),
+        'languages': result['languages'],
+        'monthly': [{k: v for k, v in month.items() if k != 'languages'} for month in result['monthly']]
+    }
+    repos, languages, types = StringTable(), StringTable(), StringTable()
+    if 'calendar' in result:
+        calendar = result['calendar']
+        days = calendar['days']
+        compact['calendar'] = {**calendar, 'days': {
+            'offset': [int(offset) for offset in days],
+            'repos': [encode_counts(day['repos'], repos) for day in days.values()],
+            'languages': [encode_counts(day['languages'], languages) for day in days.values()]
+        }}
+    compact['strings'] = {'repos': repos.values, 'languages': languages.values, 'types': types.values}
+    if 'daily' not in result:
+        return compact
+
+    daily = result['daily']
+    days = [display_day_ordinal(d['date']) for d in daily]
+    start = min(days) if days else date(date.today().year, 1, 1).toordinal()
+    compact['daily'] = {
+        'start': date.fromordinal(start).isoformat(),
+        'day': [day - start for day in days],
+        'repo': [repos.intern(d['repo']) for d in daily],
+        'language': [languages.intern(d['language']) for d in daily],
+        'type': [types.intern(d.get('type', 'commit')) for d in daily]
+    }
+    return compact
+
+
+def decode_compact(data):
+    """Compact columnar dict -> legacy result dict."""
+    result = {
+        'monthly': [{**month, 'languages': dict(data['languages'])} for month in data['monthly']],
+        'totalCommits': data['totalCommits'],
+        'uniqueReposTotal': data['uniqueReposTotal']
+    }
+    if 'daily' in data:
+        strings = data['strings']
+        columns = data['daily']
+        start = date.fromisoformat(columns['start']).toordinal()
+        result['daily'] = [
+            {
+                'date': format_day(start + offset),
+                'repo': strings['repos'][r],
+                'language': strings['languages'][l],
+                'type': strings['types'][t]
+            }
+            for offset, r, l, t in zip(columns['day'], columns['repo'], columns['language'], columns['type'])
+        ]
+    result['languages'] = data['languages']
+    if 'calendar' in data:
+        calendar = data['calendar']
+        if data.get('version', 1) >= 2:
+            strings, days = data['strings'], calendar['days']
+            calendar = {**calendar, 'days': {
+                str(offset): {'repos': decode_counts(r, strings['repos']),
+                              'languages': decode_counts(l, strings['languages'])}
+                for offset, r, l in zip(days['offset'], days['repos'], days['languages'])
+            }}
+        result['calendar'] = calendar
+    return result
+
+
+def load_result(path):
+    """Read a data.json in either format, returning the legacy structure."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return decode_compact(data) if data.get('format') == 'compact' else data
+
+
+def write_result(result, path, fmt='legacy'):
+    """Write `result` to `path` in the given format (compact also writes `<path>.gz`)."""
+    if fmt == 'compact':
+        payload = json.dumps(encode_compact(result), separators=(',', ':')).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(payload)
+        # mtime=0 keeps the .gz byte-identical when the data hasn't changed
+        with open(f'{path}.gz', 'wb') as raw, gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as gz:
+            gz.write(payload)
+        return
+
+    with open(path, 'w') as f:
+        json.dump(result, f, indent=2)
+
+
+def shard_name(year):
+    return f'data-{year}.json'
+
+
+def load_manifest(output_dir):
+    """Read `data-manifest.json` from `output_dir`, or None if there isn't one."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def final_years(manifest):
+    """Years whose shards are complete and immutable."""
+    if not manifest:
+        return set()
+    return {int(year) for year, shard in manifest.get('shards', {}).items() if shard.get('final')}
+
+
+def load_shards(output_dir, years):
+    """Legacy result dicts for the given years' shards, newest year first."""
+    return [load_result(os.path.join(output_dir, shard_name(year))) for year in sorted(years, reverse=True)]
+
+
+def write_shards(aggregator, output_dir, years, fmt='legacy', final=(), current=None, daily=True):
+    """Write one shard per year in `years` plus the manifest; returns the manifest.
+
+    Shards already marked final in an existing manifest are kept as they are.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir) or {}
+    shards = {year: info for year, info in previous.get('shards', {}).items() if info.get('final')}
+
+    for year in years:
+        if str(year) in shards:
+            continue
+        result = aggregator.for_year(year).to_result(daily)
+        write_result(result, os.path.join(output_dir, shard_name(year)), fmt)
+        shards[str(year)] = {'file': shard_name(year), 'final': year in final, 'totalCommits': result['totalCommits']}
+
+    all_years = sorted(int(year) for year in shards)
+    manifest = {
+        'years': all_years,
+        'current': current if current is not None else all_years[-1],
+        'format': fmt,
+        'shards': {str(year): shards[str(year)] for year in all_years}
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Fetch Checkpoint Journal
+------------------------
+Append-only JSONL log of the work a fetch run has finished, so a run that dies
+partway (network error, exhausted rate limit, CI timeout) can be resumed with
+`--resume` instead of spending its budget again.
+
+The first line describes the run (window, profiles, mode, ...) and holds the
+repo list; every following line is one finished unit of work:
+
+    {"run": {...}, "repos": [...]}
+    {"key": "search", "value": {...}}
+    {"key": "repo:owner/name", "value": {"languages": ..., "commits": [...], "activity": [...]}}
+
+Lines are flushed as they are written, so at most the units in flight are lost.
+A journal is only resumed by a run with the same description; the file is
+removed once the run has written its outputs.
+
+Usage:
+    journal = FetchJournal(path)
+    repos = journal.resume(run) if args.resume else None   # None: nothing to resume
+    journal.start(run, repos or get_all_repos(...))
+    ... journal.get(key) / journal.record(key, value) ...
+    journal.finish()
+"""
+
+import os
+import json
+import threading
+
+
+class FetchJournal:
+    """Checkpoints of one fetch run, keyed by unit of work."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._file = None
+        self._lock = threading.Lock()
+
+    def resume(self, run):
+        """Load a journal left by an identical run; returns its repo list, or None."""
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.read().splitlines()
+            header = json.loads(lines[0])
+        except (FileNotFoundError, IndexError, json.JSONDecodeError):
+            return None
+        if header.get('run') != run:
+            return None
+
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break   # a line cut off by the crash
+            self.entries[entry['key']] = entry['value']
+        return header['repos']
+
+    def start(self, run, repos):
+        """Open the journal for writing, keeping the entries loaded by resume().
+
+        The file is rewritten (temp file + rename, so the old checkpoints survive
+        a crash meanwhile), which also drops a line cut off by a crash.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        self._file = open(tmp_path, 'w')
+        self._write({'run': run, 'repos': repos})
+        for key, value in self.entries.items():
+            self._write({'key': key, 'value': value})
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'a')
+
+    def _write(self, entry):
+        with self._lock:
+            self._file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self._file.flush()
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def record(self, key, value):
+        """Checkpoint one finished unit of work."""
+        self.entries[key] = value
+        if self._file:
+            self._write({'key': key, 'value': value})
+
+    def finish(self):
+        """The run completed: close and remove the journal."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
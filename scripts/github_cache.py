@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+GitHub Response Cache
+---------------------
+Persistent SQLite-backed HTTP cache for the `fetch_contributions.py` scripts.
+
+Every successful GET is stored in `.cache/github/responses.sqlite3` (or
+$GITHUB_CACHE_PATH), keyed by method + URL + params (and a hash of the token),
+together with its `ETag` / `Last-Modified` validators:
+
+- Within the endpoint's TTL (see TTLS: languages for days, commits / issues /
+  searches for minutes) the stored response is served without any request.
+- After that the request is sent as a conditional request (`If-None-Match` /
+  `If-Modified-Since`); when GitHub answers `304 Not Modified` the stored body
+  is served and the TTL restarts. 304s don't count against the REST rate limit,
+  so unchanged repos cost almost nothing.
+- In offline mode nothing is sent: stored responses are served whatever their
+  age and anything else gets a synthetic `504`, so a whole fetch can be replayed
+  from the store while iterating on aggregation or output code.
+
+Old and excess entries are evicted on close (see scripts/sqlite_lru.py).
+
+Network requests go through `transport` (a `get(url, headers, params)`
+callable, e.g. `RateLimitScheduler.get`), defaulting to `requests.get`.
+
+Usage:
+    cache = ResponseCache(transport=scheduler.get)
+    response = cache.get(url, headers=headers, params=params)
+    ...
+    cache.close()   # evicts old/oversized entries and prints stats
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import requests
+
+from sqlite_lru import SQLiteLRUStore
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.getenv('GITHUB_CACHE_PATH') or os.path.join(ROOT_DIR, '.cache', 'github', 'responses.sqlite3')
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024   # 200 MB
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60     # 30 days without being used
+
+# (URL path pattern, seconds a stored response is served without revalidating)
+TTLS = [
+    (re.compile(r'/repos/[^/]+/[^/]+/languages$'), 3 * 24 * 60 * 60),
+    (re.compile(r'/repos/[^/]+/[^/]+/(commits|issues)$'), 10 * 60),
+    (re.compile(r'/user/repos$'), 10 * 60),
+    (re.compile(r'/search/issues$'), 10 * 60),
+]
+DEFAULT_TTL = 0   # always revalidate
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+def make_key(method, url, params=None, headers=None):
+    """Build a stable cache key from the request method, URL, params and token."""
+    params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    # Hash the token rather than storing it; different tokens see different data
+    auth = hashlib.sha1((headers or {}).get('Authorization', '').encode('utf-8')).hexdigest()
+    raw = json.dumps([method.upper(), url, params, auth])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def ttl_for(url):
+    """Seconds a stored response for `url` may be served without revalidating."""
+    path = url.split('?', 1)[0]
+    for pattern, ttl in TTLS:
+        if pattern.search(path):
+            return ttl
+    return DEFAULT_TTL
+
+
+def build_response(url, status_code, headers, body):
+    """Create a `requests.Response` from cached parts so callers can't tell the difference."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers)
+    response._content = body.encode('utf-8')
+    response.encoding = 'utf-8'
+    return response
+
+
+class ResponseCache(SQLiteLRUStore):
+    """ETag / Last-Modified aware response cache stored in one SQLite database."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES,
+                 max_age=DEFAULT_MAX_AGE, enabled=True, transport=None, offline=False):
+        super().__init__(path, SCHEMA, 'responses', max_bytes, max_age, enabled)
+        self.transport = transport
+        self.offline = offline
+        self.stats.update({'hits': 0, 'fresh': 0, 'not_modified': 0, 'misses': 0, 'offline_misses': 0,
+                           'bytes_saved': 0})
+
+    def _load(self, key):
+        with self._lock:
+            row = self.db.execute(
+                'SELECT headers, body, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        headers, body, etag, last_modified, stored_at = row
+        return {'headers': json.loads(headers), 'body': body, 'etag': etag,
+                'last_modified': last_modified, 'stored_at': stored_at}
+
+    def _store(self, key, url, params, response):
+        body = response.text
+        headers = {k: v for k, v in response.headers.items() if k.lower() in ('link', 'content-type')}
+        now = time.time()
+        with self._lock:
+            self.db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, 'GET', url, json.dumps(params or {}, sort_keys=True), response.status_code,
+                 json.dumps(headers), body, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 now, now, len(body.encode('utf-8')))
+            )
+            self.db.commit()
+
+    def _touch(self, key, revalidated=False):
+        """Mark an entry as used (for LRU); a 304 also restarts its TTL."""
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self.db.execute('UPDATE responses SET last_used = ?, stored_at = ? WHERE key = ?', (now, now, key))
+            else:
+                self.db.execute('UPDATE responses SET last_used = ? WHERE key = ?', (now, key))
+            self.db.commit()
+
+    def _count(self, stat, amount=1):
+        with self._lock:
+            self.stats[stat] += amount
+
+    def _send(self, url, headers, params):
+        return (self.transport or requests.get)(url, headers=headers, params=params)
+
+    def _serve(self, key, url, entry, stat, live_headers=None):
+        """Return a stored entry as a 200 response and update the stats."""
+        self._count('hits')
+        self._count(stat)
+        self._count('bytes_saved', len(entry['body'].encode('utf-8')))
+        self._touch(key, revalidated=(stat == 'not_modified'))
+        headers = dict(entry['headers'])
+        # Rate-limit headers must reflect *this* response, not the stored one
+        for name, value in (live_headers or {}).items():
+            if name.lower().startswith('x-ratelimit'):
+                headers[name] = value
+        return build_response(url, 200, headers, entry['body'])
+
+    def get(self, url, headers=None, params=None):
+        """GET `url`, serving a fresh stored copy or revalidating it with a conditional request."""
+        if not self.enabled and not self.offline:
+            self._count('misses')
+            return self._send(url, headers, params)
+
+        key = make_key('GET', url, params, headers)
+        entry = self._load(key)
+
+        if self.offline:
+            if entry:
+                return self._serve(key, url, entry, 'fresh')
+            self._count('offline_misses')
+            return build_response(url, 504, {'Content-Type': 'application/json'},
+                                  json.dumps({'message': f'Offline: no stored response for {url}'}))
+
+        if entry and time.time() - entry['stored_at'] < ttl_for(url):
+            return self._serve(key, url, entry, 'fresh')
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._send(url, request_headers, params)
+
+        if response.status_code == 304 and entry:
+            return self._serve(key, response.url or url, entry, 'not_modified', response.headers)
+
+        self._count('misses')
+        if response.status_code == 200:
+            self._store(key, url, params, response)
+        return response
+
+    def summary(self):
+        """Return a one-line, human readable stats summary."""
+        s = self.stats
+        requests_made = s['hits'] + s['misses']
+        hit_rate = (s['hits'] / requests_made) * 100 if requests_made else 0
+        line = (f"HTTP cache: {s['hits']} hits ({s['fresh']} fresh, {s['not_modified']} x 304, {hit_rate:.0f}%), "
+                f"{s['misses']} misses, {s['bytes_saved'] / 1024:.1f} KB saved, {s['evicted']} evicted")
+        if self.offline:
+            line += f", {s['offline_misses']} not stored (offline)"
+        return line
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+GitHub GraphQL Engine
+---------------------
+Alternative backend for `fetch/fetch_contributions.py` that replaces the
+per-repo REST calls (languages, commit pages, issue pages) with a handful of
+aliased GraphQL queries.
+
+One `RepoBatch` query returns, for up to BATCH_SIZE repositories at once:
+- the language breakdown (bytes per language),
+- the first page of the user's commits on the default branch since the window start,
+- the first page of PRs/issues the user created in the window (via `search`).
+
+Only repositories whose history or activity overflows that first page are
+followed up with cursor-paginated `CommitHistory` / `RepoActivity` queries.
+
+Results are converted to the same records the REST helpers yield, so the
+aggregation in `main()` doesn't care which engine produced them.
+
+Point GITHUB_API_URL at `scripts/github_stub_server.py` to run it offline.
+"""
+
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+GRAPHQL_URL = f'{API_URL}/graphql'
+BATCH_SIZE = 20
+PAGE_SIZE = 100
+
+REPO_LIST_QUERY = """
+query RepoList($cursor: String) {
+  viewer {
+    id
+    login
+    repositories(first: 100, after: $cursor,
+                 affiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+                 ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name nameWithOwner isPrivate primaryLanguage { name } owner { login __typename } }
+    }
+  }
+}
+"""
+
+HISTORY_FIELDS = "pageInfo { hasNextPage endCursor } nodes { oid authoredDate committedDate }"
+ACTIVITY_FIELDS = """pageInfo { hasNextPage endCursor }
+    nodes {
+      __typename
+      ... on Issue { databaseId createdAt }
+      ... on PullRequest { databaseId createdAt }
+    }"""
+
+COMMIT_HISTORY_QUERY = f"""
+query CommitHistory($owner: String!, $name: String!, $since: GitTimestamp!, $authorId: ID!, $cursor: String!) {{
+  repository(owner: $owner, name: $name) {{
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(first: {PAGE_SIZE}, after: $cursor, since: $since, author: {{id: $authorId}}) {{ {HISTORY_FIELDS} }}
+        }}
+      }}
+    }}
+  }}
+}}
+"""
+
+REPO_ACTIVITY_QUERY = f"""
+query RepoActivity($q: String!, $cursor: String!) {{
+  search(query: $q, type: ISSUE, first: {PAGE_SIZE}, after: $cursor) {{
+    {ACTIVITY_FIELDS}
+  }}
+}}
+"""
+
+
+def build_batch_query(count):
+    """Build an aliased RepoBatch query for `count` repositories (r0..rN / a0..aN)."""
+    params = ['$authorId: ID!']
+    fields = []
+    for i in range(count):
+        params.append(f'$o{i}: String!, $n{i}: String!, $s{i}: GitTimestamp!, $q{i}: String!')
+        fields.append(f"""
+  r{i}: repository(owner: $o{i}, name: $n{i}) {{
+    languages(first: 100, orderBy: {{field: SIZE, direction: DESC}}) {{ edges {{ size node {{ name }} }} }}
+    defaultBranchRef {{
+      target {{
+        ... on Commit {{
+          history(first: {PAGE_SIZE}, since: $s{i}, author: {{id: $authorId}}) {{ {HISTORY_FIELDS} }}
+        }}
+      }}
+    }}
+  }}
+  a{i}: search(query: $q{i}, type: ISSUE, first: {PAGE_SIZE}) {{
+    {ACTIVITY_FIELDS}
+  }}""")
+    return f"query RepoBatch({', '.join(params)}) {{{''.join(fields)}\n}}\n"
+
+
+def activity_query(full_name, login, since):
+    """Search query for PRs/issues `login` created in `full_name` since `since`."""
+    return f'repo:{full_name} author:{login} created:>={since}'
+
+
+def to_commit(node):
+    """Convert a GraphQL commit node to the projected commit record used by main()."""
+    return {
+        'sha': node['oid'],
+        'date': node['authoredDate'],
+        'committed_at': node['committedDate']
+    }
+
+
+def to_activity(node, full_name, since):
+    """Convert a GraphQL Issue/PullRequest node to an activity record (or None)."""
+    if not node or 'createdAt' not in node or node['createdAt'] < since:
+        return None
+    return {
+        'id': node['databaseId'],
+        'type': 'pr' if node['__typename'] == 'PullRequest' else 'issue',
+        'date': node['createdAt'][:10],
+        'created_at': node['createdAt'],
+        'repo': full_name
+    }
+
+
+def history_of(repository):
+    """Return the commit history connection of a repository node (or None)."""
+    branch = (repository or {}).get('defaultBranchRef') or {}
+    return (branch.get('target') or {}).get('history')
+
+
+class GraphQLEngine:
+    """Fetches repos, languages, commits and activity through the GraphQL API."""
+
+    def __init__(self, token, url=GRAPHQL_URL, batch_size=BATCH_SIZE, transport=None):
+        self.url = url
+        self.transport = transport or requests.post
+        self.batch_size = batch_size
+        self.headers = {'Authorization': f'bearer {token}'}
+        self.viewer_id = None
+        self.login = None
+
+    def query(self, query, variables):
+        """Run a GraphQL query; returns the `data` dict (partial data on errors)."""
+        response = self.transport(self.url, headers=self.headers, json={'query': query, 'variables': variables})
+        if response.status_code != 200:
+            print(f"GraphQL error: {response.status_code}")
+            return {}
+
+        payload = response.json()
+        for error in payload.get('errors', []):
+            print(f"GraphQL error: {error.get('message')}")
+        return payload.get('data') or {}
+
+    def get_all_repos(self):
+        """Get all repositories (owner, collaborator, org), in REST repo shape."""
+        repos = []
+        cursor = None
+        while True:
+            data = self.query(REPO_LIST_QUERY, {'cursor': cursor})
+            viewer = data.get('viewer')
+            if not viewer:
+                break
+
+            self.viewer_id = viewer['id']
+            self.login = viewer['login']
+            connection = viewer['repositories']
+            for node in connection['nodes']:
+                repos.append({
+                    'name': node['name'],
+                    'full_name': node['nameWithOwner'],
+                    'private': node['isPrivate'],
+                    'language': (node.get('primaryLanguage') or {}).get('name'),
+                    'owner': (node.get('owner') or {}).get('login'),
+                    'owner_type': (node.get('owner') or {}).get('__typename')
+                })
+
+            if not connection['pageInfo']['hasNextPage']:
+                break
+            cursor = connection['pageInfo']['endCursor']
+        return repos
+
+    def _more_commits(self, repo, since, cursor):
+        """Follow the commit history cursor for a repo that overflowed its first page."""
+        owner, name = repo['full_name'].split('/', 1)
+        commits = []
+        while cursor:
+            data = self.query(COMMIT_HISTORY_QUERY, {
+                'owner': owner, 'name': name, 'since': since,
+                'authorId': self.viewer_id, 'cursor': cursor
+            })
+            history = history_of(data.get('repository'))
+            if not history:
+                break
+            commits.extend(to_commit(n) for n in history['nodes'])
+            cursor = history['pageInfo']['endCursor'] if history['pageInfo']['hasNextPage'] else None
+        return commits
+
+    def _more_activity(self, repo, since, cursor):
+        """Follow the search cursor for a repo whose PR/issue list overflowed."""
+        q = activity_query(repo['full_name'], self.login, since)
+        activity = []
+        while cursor:
+            search = self.query(REPO_ACTIVITY_QUERY, {'q': q, 'cursor': cursor}).get('search')
+            if not search:
+                break
+            activity.extend(a for a in (to_activity(n, repo['full_name'], since) for n in search['nodes']) if a)
+            cursor = search['pageInfo']['endCursor'] if search['pageInfo']['hasNextPage'] else None
+        return activity
+
+    def fetch_batch(self, batch):
+        """Fetch one batch of (repo, commit_since, activity_since) with a single RepoBatch query."""
+        variables = {'authorId': self.viewer_id}
+        for i, (repo, commit_since, activity_since) in enumerate(batch):
+            owner, name = repo['full_name'].split('/', 1)
+            variables.update({
+                f'o{i}': owner, f'n{i}': name, f's{i}': commit_since,
+                f'q{i}': activity_query(repo['full_name'], self.login, activity_since)
+            })
+        data = self.query(build_batch_query(len(batch)), variables)
+
+        results = []
+        for i, (repo, commit_since, activity_since) in enumerate(batch):
+            repository = data.get(f'r{i}') or {}
+            languages = {
+                edge['node']['name']: edge['size']
+                for edge in ((repository.get('languages') or {}).get('edges') or [])
+            }
+
+            commits = []
+            history = history_of(repository)
+            if history:
+                commits = [to_commit(n) for n in history['nodes']]
+                if history['pageInfo']['hasNextPage']:
+                    commits.extend(self._more_commits(repo, commit_since, history['pageInfo']['endCursor']))
+
+            activity = []
+            search = data.get(f'a{i}')
+            if search:
+                activity = [a for a in (to_activity(n, repo['full_name'], activity_since) for n in search['nodes']) if a]
+                if search['pageInfo']['hasNextPage']:
+                    activity.extend(self._more_activity(repo, activity_since, search['pageInfo']['endCursor']))
+
+            results.append((repo, languages, commits, activity))
+        return results
+
+    def fetch_all_repos(self, repos, since, workers=1, watermarks=None):
+        """Fetch every repo in batches, returning (repo, languages, commits, activity) in `repos` order."""
+        if self.viewer_id is None:
+            self.get_all_repos()
+
+        watermarks = watermarks or {}
+        jobs = []
+        for repo in repos:
+            watermark = watermarks.get(repo['full_name']) or {}
+            jobs.append((repo, watermark.get('commit_date', since), watermark.get('activity_created_at', since)))
+        batches = [jobs[i:i + self.batch_size] for i in range(0, len(jobs), self.batch_size)]
+
+        if workers <= 1:
+            batch_results = [self.fetch_batch(b) for b in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                batch_results = list(pool.map(self.fetch_batch, batches))
+        return [result for batch in batch_results for result in batch]
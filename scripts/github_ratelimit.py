@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+GitHub Rate-Limit Scheduler
+---------------------------
+Central gate for every outgoing GitHub request (REST and GraphQL).
+
+- Tracks the budget per resource (core / search / graphql) from the
+  `X-RateLimit-Limit`, `X-RateLimit-Remaining` and `X-RateLimit-Reset` headers.
+- Throttles how many requests may be in flight as the budget runs low, and
+  blocks until the reset time once it is exhausted.
+- Retries 403/429 responses instead of letting callers silently stop paging:
+  `Retry-After` is honoured exactly, an exhausted primary limit waits for the
+  reset, and secondary ("abuse") limits back off exponentially.
+
+Usage:
+    scheduler = RateLimitScheduler(max_concurrency=8)
+    cache = ResponseCache(transport=scheduler.get)
+    engine = GraphQLEngine(token, transport=scheduler.post)
+    ...
+    print(scheduler.summary())
+"""
+
+import math
+import time
+import threading
+import requests
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_LOW_WATERMARK = 200     # Below this many remaining calls, start shrinking concurrency
+DEFAULT_MAX_RETRIES = 5
+SECONDARY_BACKOFF = 60          # GitHub asks for at least a minute after a secondary limit
+RESET_MARGIN = 1                # Seconds added to X-RateLimit-Reset to absorb clock skew
+
+
+def resource_for(url):
+    """Guess the rate-limit resource a URL is billed against (before we see the headers)."""
+    if '/graphql' in url:
+        return 'graphql'
+    if '/search/' in url:
+        return 'search'
+    return 'core'
+
+
+class RateLimitScheduler:
+    """Budget-aware request gate shared by all GitHub fetch paths."""
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, low_watermark=DEFAULT_LOW_WATERMARK,
+                 max_retries=DEFAULT_MAX_RETRIES, session=None, sleep=time.sleep, clock=time.time):
+        self.max_concurrency = max_concurrency
+        self.low_watermark = low_watermark
+        self.max_retries = max_retries
+        self.session = session or requests
+        self.sleep = sleep
+        self.clock = clock
+
+        self.budgets = {}   # resource -> {'limit', 'remaining', 'reset'}
+        self.active = 0
+        self.stats = {'requests': 0, 'waits': 0, 'wait_seconds': 0.0, 'retries': 0,
+                      'secondary_limits': 0, 'gave_up': 0}
+        self._cond = threading.Condition()
+
+    # --- Budget tracking --------------------------------------------------
+
+    def allowed_concurrency(self, resource):
+        """How many requests may be in flight given the remaining budget."""
+        budget = self.budgets.get(resource)
+        if not budget or budget['remaining'] >= self.low_watermark:
+            return self.max_concurrency
+        share = budget['remaining'] / self.low_watermark
+        return max(1, math.ceil(self.max_concurrency * share))
+
+    def _seconds_until_reset(self, resource):
+        budget = self.budgets.get(resource)
+        if not budget or budget['remaining'] > 0:
+            return 0
+        return max(0, budget['reset'] + RESET_MARGIN - self.clock())
+
+    def observe(self, response):
+        """Update the budget from a response's rate-limit headers."""
+        headers = response.headers
+        if 'X-RateLimit-Remaining' not in headers:
+            return
+        resource = headers.get('X-RateLimit-Resource') or resource_for(response.url or '')
+        with self._cond:
+            self.budgets[resource] = {
+                'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                'remaining': int(headers['X-RateLimit-Remaining']),
+                'reset': int(headers.get('X-RateLimit-Reset', 0))
+            }
+            self._cond.notify_all()
+
+    def _wait(self, seconds, reason):
+        if seconds <= 0:
+            return
+        with self._cond:
+            self.stats['waits'] += 1
+            self.stats['wait_seconds'] += seconds
+        print(f"⏳ GitHub {reason}: waiting {seconds:.0f}s...")
+        self.sleep(seconds)
+
+    def _acquire(self, resource):
+        while True:
+            wait = self._seconds_until_reset(resource)
+            if wait:
+                self._wait(wait, f'{resource} rate limit exhausted')
+                with self._cond:
+                    # The reset has passed; forget the stale budget until the next response
+                    if self.budgets.get(resource, {}).get('remaining') == 0:
+                        self.budgets.pop(resource, None)
+                continue
+            with self._cond:
+                if self.active < self.allowed_concurrency(resource):
+                    self.active += 1
+                    return
+                self._cond.wait(timeout=1)
+
+    def _release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    # --- Retry policy -----------------------------------------------------
+
+    def retry_delay(self, response, attempt):
+        """Seconds to wait before retrying `response`, or None if it shouldn't be retried."""
+        if response.status_code not in (403, 429) and not self._graphql_rate_limited(response):
+            return None
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            return float(retry_after)
+
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            return max(0, reset + RESET_MARGIN - self.clock())
+
+        text = response.text.lower()
+        if response.status_code == 429 or 'secondary rate limit' in text or 'abuse' in text:
+            with self._cond:
+                self.stats['secondary_limits'] += 1
+            return SECONDARY_BACKOFF * (2 ** attempt)
+
+        return None  # A genuine 403 (no access); retrying won't help
+
+    def _graphql_rate_limited(self, response):
+        if response.status_code != 200 or '/graphql' not in (response.url or ''):
+            return False
+        try:
+            errors = response.json().get('errors') or []
+        except ValueError:
+            return False
+        return any(e.get('type') == 'RATE_LIMITED' for e in errors)
+
+    # --- Public API -------------------------------------------------------
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the scheduler, retrying rate-limited responses."""
+        resource = resource_for(url)
+        for attempt in range(self.max_retries + 1):
+            self._acquire(resource)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            finally:
+                self._release()
+
+            with self._cond:
+                self.stats['requests'] += 1
+            self.observe(response)
+
+            delay = self.retry_delay(response, attempt)
+            if delay is None:
+                return response
+            if attempt == self.max_retries:
+                break
+
+            with self._cond:
+                self.stats['retries'] += 1
+            self._wait(delay, f'rate limit ({response.status_code}) on {url}')
+
+        with self._cond:
+            self.stats['gave_up'] += 1
+        print(f"❌ Giving up on {url} after {self.max_retries} retries ({response.status_code})")
+        return response
+
+    def get(self, url, headers=None, params=None):
+        return self.request('GET', url, headers=headers, params=params)
+
+    def post(self, url, headers=None, json=None):
+        return self.request('POST', url, headers=headers, json=json)
+
+    def state(self):
+        """Snapshot of budgets and counters, for logging."""
+        with self._cond:
+            return {'budgets': {k: dict(v) for k, v in self.budgets.items()},
+                    'active': self.active, **self.stats}
+
+    def summary(self):
+        """One-line, human readable state summary."""
+        s = self.state()
+        budgets = ', '.join(f"{name} {b['remaining']}/{b['limit']}" for name, b in sorted(s['budgets'].items()))
+        return (f"Rate limits: {budgets or 'unknown'} remaining; {s['requests']} requests, "
+                f"{s['retries']} retries, {s['waits']} waits ({s['wait_seconds']:.0f}s), "
+                f"{s['secondary_limits']} secondary limits, {s['gave_up']} gave up")
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+GitHub API Stub Server
+----------------------
+Local stand-in for the GitHub API so the fetchers can be run offline.
+
+Serves a synthetic (or fixture-loaded) account through:
+- the REST endpoints the fetchers call (`/user/repos`, `/repos/*/languages`,
+  `/repos/*/commits`, `/repos/*/issues`, `/search/issues`), with page/per_page
+  pagination, `Link: rel="next"/"last"` headers and ETags (`If-None-Match` -> 304);
+- the GraphQL endpoint used by `scripts/github_graphql.py`. It understands the
+  operations that engine sends (RepoList, RepoBatch, CommitHistory,
+  RepoActivity), not GraphQL in general.
+
+With `--replay` the REST routes serve the responses recorded in the fetchers'
+response cache (`.cache/github/responses.sqlite3`) instead.
+
+`--latency` delays every response; requests and response bytes are counted
+(`GET /_stub/stats`) for `scripts/benchmark_fetch.py`.
+
+Usage:
+    python scripts/github_stub_server.py [--port 8787] [--repos 30] [--commits 250] [--page-size 100] [--latency 50]
+    python scripts/github_stub_server.py --fixture stub_fixture.json
+    python scripts/github_stub_server.py --replay .cache/github/responses.sqlite3
+
+    GITHUB_API_URL=http://127.0.0.1:8787 GITHUB_TOKEN=stub \\
+        python fetch/fetch_contributions.py [--engine graphql]
+
+Fixture format:
+    {"login": "...", "repos": [{"name", "full_name", "private", "language", "pushed_at" (optional),
+      "languages": {lang: bytes}, "commits": [{"sha", "authored", "committed"}],
+      "activity": [{"id", "type": "pr"|"issue", "created_at"}]}]}
+"""
+
+import re
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+DEFAULT_PORT = 8787
+GITHUB_API = 'https://api.github.com'
+LANGUAGES = ['Python', 'TypeScript', 'JavaScript', 'HTML', 'CSS', 'Shell']
+SEARCH_RESULT_CAP = 1000   # GitHub's search API won't page past this many results
+
+
+def synthetic_dataset(login='akashagl92', repos=30, commits=250, activity=20, seed=42, start='2025-01-01'):
+    """Generate a reproducible account with `repos` repos and up to `commits` commits each."""
+    rng = random.Random(seed)
+    start_dt = datetime.strptime(start, '%Y-%m-%d')
+    span = 364 * 24 * 3600
+    dataset = {'login': login, 'repos': []}
+
+    def stamp():
+        return (start_dt + timedelta(seconds=rng.randrange(span))).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    next_id = 1
+    for i in range(repos):
+        owner = login if i % 4 else f'org-{i % 3}'
+        langs = rng.sample(LANGUAGES, rng.randint(1, 4))
+        repo = {
+            'name': f'repo-{i:03d}',
+            'full_name': f'{owner}/repo-{i:03d}',
+            'private': i % 2 == 0,
+            'language': langs[0],
+            'languages': {lang: rng.randint(1000, 500000) for lang in langs},
+            'commits': [],
+            'activity': []
+        }
+        for k in range(rng.randint(0, commits)):
+            ts = stamp()
+            repo['commits'].append({'sha': f'{i:03d}{k:05d}'.ljust(40, '0'), 'authored': ts, 'committed': ts})
+        for _ in range(rng.randint(0, activity)):
+            repo['activity'].append({'id': next_id, 'type': rng.choice(['pr', 'issue']), 'created_at': stamp()})
+            next_id += 1
+        # Newest first, like the API
+        repo['commits'].sort(key=lambda c: c['committed'], reverse=True)
+        repo['activity'].sort(key=lambda a: a['created_at'], reverse=True)
+        dataset['repos'].append(repo)
+    return dataset
+
+
+class StubGitHub:
+    """In-memory account plus the query logic shared by all routes."""
+
+    def __init__(self, dataset, page_size=100, latency=0.0, replay=None):
+        self.login = dataset['login']
+        self.repos = dataset['repos']
+        self.by_full_name = {r['full_name']: r for r in self.repos}
+        self.page_size = page_size
+        self.latency = latency
+        self.replay = replay or {}
+        self.request_count = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.request_count += 1
+
+    def count_bytes(self, n):
+        with self._lock:
+            self.bytes_sent += n
+
+    def stats(self):
+        return {'requests': self.request_count, 'bytes': self.bytes_sent}
+
+    def page(self, items, first, cursor):
+        """Slice `items` for cursor pagination; cursors are stringified offsets."""
+        offset = int(cursor or 0)
+        size = min(first, self.page_size)
+        chunk = items[offset:offset + size]
+        end = offset + len(chunk)
+        return chunk, {'hasNextPage': end < len(items), 'endCursor': str(end)}
+
+    def commits_since(self, repo, since):
+        return [c for c in repo['commits'] if c['committed'] >= since]
+
+    def search_activity(self, q):
+        """Evaluate an issue search (`author:`, optional `repo:` / `is:pr|issue`, `created:>=T` or `A..B`).
+
+        Returns (repo, item) pairs, newest first.
+        """
+        terms = dict(t.split(':', 1) for t in q.split() if ':' in t)
+        if terms.get('author') != self.login:
+            return []
+        repos = [self.by_full_name[terms['repo']]] if terms.get('repo') in self.by_full_name else []
+        if 'repo' not in terms:
+            repos = self.repos
+        kind = {'pr': 'pr', 'pull-request': 'pr', 'issue': 'issue'}.get(terms.get('is'))
+        created = terms.get('created', '>=')
+        low, high = created.split('..', 1) if '..' in created else (created.lstrip('>='), '9999')
+        found = [(repo, a) for repo in repos for a in repo['activity']
+                 if low <= a['created_at'] <= high and kind in (None, a['type'])]
+        return sorted(found, key=lambda x: x[1]['created_at'], reverse=True)
+
+    # --- REST ------------------------------------------------------------
+
+    def rest_page(self, items, path, query, base_url):
+        """Slice `items` by page/per_page; returns (items, Link header or None)."""
+        per_page = min(int(query.get('per_page', 30)), self.page_size)
+        page = int(query.get('page', 1))
+        chunk = items[(page - 1) * per_page:page * per_page]
+        last = max(1, -(-len(items) // per_page))
+        if page >= last:
+            return chunk, None
+        link = lambda n, rel: f'<{base_url}{path}?{urlencode({**query, "page": n})}>; rel="{rel}"'
+        return chunk, f'{link(page + 1, "next")}, {link(last, "last")}'
+
+    def rest_repo(self, repo):
+        owner = repo['full_name'].split('/')[0]
+        return {
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'private': repo['private'],
+            'language': repo['language'],
+            'pushed_at': repo.get('pushed_at') or max((c['committed'] for c in repo['commits']),
+                                                      default='2024-06-01T00:00:00Z'),
+            'owner': {'login': owner, 'type': 'User' if owner == self.login else 'Organization'},
+            'url': f"{GITHUB_API}/repos/{repo['full_name']}",
+            'html_url': f"https://github.com/{repo['full_name']}"
+        }
+
+    def rest_commit(self, repo, commit):
+        return {
+            'sha': commit['sha'],
+            'url': f"{GITHUB_API}/repos/{repo['full_name']}/commits/{commit['sha']}",
+            'commit': {
+                'author': {'name': self.login, 'email': f'{self.login}@users.noreply.github.com', 'date': commit['authored']},
+                'committer': {'name': self.login, 'email': f'{self.login}@users.noreply.github.com', 'date': commit['committed']},
+                'message': f"Commit {commit['sha'][:7]}"
+            },
+            'author': {'login': self.login}
+        }
+
+    def rest_issue(self, repo, item):
+        issue = {
+            'id': item['id'],
+            'url': f"{GITHUB_API}/repos/{repo['full_name']}/issues/{item['id']}",
+            'title': f"{item['type'].upper()} {item['id']}",
+            'user': {'login': self.login},
+            'state': 'closed',
+            'created_at': item['created_at'],
+            'updated_at': item['created_at']
+        }
+        if item['type'] == 'pr':
+            issue['pull_request'] = {'url': f"{GITHUB_API}/repos/{repo['full_name']}/pulls/{item['id']}"}
+        return issue
+
+    def rest(self, path, query, base_url):
+        """Answer a REST GET; returns (status, body, Link header or None)."""
+        if self.replay:
+            return self.replay_rest(path, query, base_url)
+
+        if path == '/search/issues':
+            found = self.search_activity(query.get('q', ''))
+            per_page = min(int(query.get('per_page', 30)), self.page_size)
+            if (int(query.get('page', 1)) - 1) * per_page >= SEARCH_RESULT_CAP:
+                return 422, {'message': 'Only the first 1000 search results are available'}, None
+            items, link = self.rest_page(found[:SEARCH_RESULT_CAP], path, query, base_url)
+            issues = []
+            for repo, item in items:
+                issue = self.rest_issue(repo, item)
+                issue['repository_url'] = f"{GITHUB_API}/repos/{repo['full_name']}"
+                issues.append(issue)
+            return 200, {'total_count': len(found), 'incomplete_results': False, 'items': issues}, link
+
+        if path == '/user/repos':
+            wanted = set((query.get('affiliation') or 'owner,collaborator,organization_member').split(','))
+            repos = [self.rest_repo(r) for r in self.repos]
+            repos = [r for r in repos if ('owner' if r['owner']['login'] == self.login else
+                                          'organization_member' if r['owner']['type'] == 'Organization'
+                                          else 'collaborator') in wanted]
+            return (200, *self.rest_page(repos, path, query, base_url))
+
+        match = re.fullmatch(r'/repos/([^/]+/[^/]+)/(languages|commits|issues)', path)
+        repo = self.by_full_name.get(match.group(1)) if match else None
+        if not repo:
+            return 404, {'message': 'Not Found'}, None
+
+        endpoint = match.group(2)
+        if endpoint == 'languages':
+            return 200, repo['languages'], None
+        if endpoint == 'commits':
+            commits = [c for c in repo['commits']
+                       if query.get('author', self.login) == self.login
+                       and c['committed'] >= query.get('since', '')
+                       and c['committed'] <= query.get('until', '9999')]
+            items, link = self.rest_page(commits, path, query, base_url)
+            return 200, [self.rest_commit(repo, c) for c in items], link
+
+        # Issues: `since` filters on updated_at (== created_at here), `creator` on the author
+        activity = [a for a in repo['activity']
+                    if query.get('creator', self.login) == self.login and a['created_at'] >= query.get('since', '')]
+        items, link = self.rest_page(activity, path, query, base_url)
+        return 200, [self.rest_issue(repo, a) for a in items], link
+
+    def replay_rest(self, path, query, base_url):
+        """Serve a recorded response, pointing its Link header at this server."""
+        entry = self.replay.get(replay_key(path, query))
+        if not entry:
+            return 404, {'message': f'Not recorded: {path}'}, None
+        link = entry['headers'].get('Link') or entry['headers'].get('link')
+        if link:
+            # Recorded against GitHub (or another stub); point the pages back here
+            link = re.sub(r'<https?://[^/>]+', f'<{base_url}', link)
+        return entry['status'], json.loads(entry['body']), link
+
+    # --- GraphQL ---------------------------------------------------------
+
+    def gql_history(self, repo, since, first, cursor):
+        nodes, info = self.page(self.commits_since(repo, since), first, cursor)
+        return {'defaultBranchRef': {'target': {'history': {
+            'pageInfo': info,
+            'nodes': [{'oid': c['sha'], 'authoredDate': c['authored'], 'committedDate': c['committed']} for c in nodes]
+        }}}}
+
+    def gql_search(self, q, first, cursor):
+        nodes, info = self.page([a for _, a in self.search_activity(q)], first, cursor)
+        return {'pageInfo': info, 'nodes': [{
+            '__typename': 'PullRequest' if a['type'] == 'pr' else 'Issue',
+            'databaseId': a['id'],
+            'createdAt': a['created_at']
+        } for a in nodes]}
+
+    def graphql(self, query, variables):
+        """Answer one of the engine's operations; returns the `data` payload."""
+        op = re.search(r'query\s+(\w+)', query).group(1)
+        first = int((re.search(r'first:\s*(\d+)', query) or [None, 100])[1])
+
+        if op == 'RepoList':
+            nodes, info = self.page(self.repos, first, variables.get('cursor'))
+            return {'viewer': {'id': 'U_stub', 'login': self.login, 'repositories': {
+                'pageInfo': info,
+                'nodes': [{
+                    'name': r['name'], 'nameWithOwner': r['full_name'], 'isPrivate': r['private'],
+                    'primaryLanguage': {'name': r['language']} if r['language'] else None,
+                    'owner': {'login': r['full_name'].split('/')[0],
+                              '__typename': 'User' if r['full_name'].split('/')[0] == self.login else 'Organization'}
+                } for r in nodes]
+            }}}
+
+        if op == 'RepoBatch':
+            data = {}
+            for alias, o, n, s in re.findall(
+                    r'(r\d+): repository\(owner: \$(o\d+), name: \$(n\d+)\).*?since: \$(s\d+)', query, re.S):
+                repo = self.by_full_name.get(f'{variables[o]}/{variables[n]}')
+                if not repo:
+                    data[alias] = None
+                    continue
+                entry = self.gql_history(repo, variables[s], first, None)
+                entry['languages'] = {'edges': [
+                    {'size': size, 'node': {'name': lang}}
+                    for lang, size in sorted(repo['languages'].items(), key=lambda x: -x[1])
+                ]}
+                data[alias] = entry
+            for alias, q in re.findall(r'(a\d+): search\(query: \$(q\d+)', query):
+                data[alias] = self.gql_search(variables[q], first, None)
+            return data
+
+        if op == 'CommitHistory':
+            repo = self.by_full_name.get(f"{variables['owner']}/{variables['name']}")
+            if not repo:
+                return {'repository': None}
+            return {'repository': self.gql_history(repo, variables['since'], first, variables.get('cursor'))}
+
+        if op == 'RepoActivity':
+            return {'search': self.gql_search(variables['q'], first, variables.get('cursor'))}
+
+        raise ValueError(f'Unsupported operation: {op}')
+
+
+def replay_key(path, query):
+    """Match recorded requests regardless of host and of params-vs-query-string."""
+    return path.rstrip('/'), tuple(sorted((str(k), str(v)) for k, v in query.items()))
+
+
+def load_replay(path):
+    """Load recorded GET responses from a fetcher response cache (responses.sqlite3)."""
+    replay = {}
+    db = sqlite3.connect(path)
+    try:
+        for url, params, status, headers, body in db.execute(
+                "SELECT url, params, status, headers, body FROM responses WHERE method = 'GET'"):
+            parts = urlsplit(url)
+            query = dict(parse_qsl(parts.query))
+            query.update(json.loads(params))
+            replay[replay_key(parts.path, query)] = {'status': status, 'headers': json.loads(headers), 'body': body}
+    finally:
+        db.close()
+    return replay
+
+
+def make_handler(stub):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, status, body, headers=None):
+            payload = json.dumps(body).encode('utf-8')
+            etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+            if status == 200 and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('ETag', etag)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+            stub.count_bytes(len(payload))
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == '/_stub/stats':
+                return self.send_json(200, stub.stats())
+
+            stub.count_request()
+            if stub.latency:
+                time.sleep(stub.latency)
+            base_url = f"http://{self.headers.get('Host', '127.0.0.1')}"
+            status, body, link = stub.rest(parts.path.rstrip('/'), dict(parse_qsl(parts.query)), base_url)
+            self.send_json(status, body, {'Link': link} if link else None)
+
+        def do_POST(self):
+            stub.count_request()
+            if stub.latency:
+                time.sleep(stub.latency)
+            if self.path.rstrip('/') != '/graphql':
+                return self.send_json(404, {'message': 'Not Found'})
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            try:
+                data = stub.graphql(body.get('query', ''), body.get('variables') or {})
+            except (ValueError, KeyError, AttributeError) as e:
+                return self.send_json(200, {'data': None, 'errors': [{'message': str(e)}]})
+            self.send_json(200, {'data': data})
+
+    return Handler
+
+
+def serve(stub, port=DEFAULT_PORT, host='127.0.0.1'):
+    """Start the stub in a background thread; returns the server (call .shutdown() to stop)."""
+    server = ThreadingHTTPServer((host, port), make_handler(stub))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def build_stub(args):
+    """Build a StubGitHub from parsed CLI options (shared with benchmark_fetch.py)."""
+    if args.fixture:
+        with open(args.fixture, 'r') as f:
+            dataset = json.load(f)
+    else:
+        dataset = synthetic_dataset(repos=args.repos, commits=args.commits, activity=args.activity, seed=args.seed)
+    replay = load_replay(args.replay) if args.replay else None
+    return StubGitHub(dataset, page_size=args.page_size, latency=args.latency / 1000, replay=replay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local GitHub API stub for offline fetcher runs")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--fixture', help="Serve this dataset JSON instead of synthetic data")
+    parser.add_argument('--repos', type=int, default=30, help="Synthetic: number of repos")
+    parser.add_argument('--commits', type=int, default=250, help="Synthetic: max commits per repo")
+    parser.add_argument('--activity', type=int, default=20, help="Synthetic: max PRs/issues per repo")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic: random seed")
+    parser.add_argument('--page-size', type=int, default=100, help="Max items per page (lower it to exercise pagination)")
+    parser.add_argument('--latency', type=float, default=0, help="Milliseconds added to every response")
+    parser.add_argument('--replay', help="Serve REST responses recorded in this responses.sqlite3 instead")
+    args = parser.parse_args()
+
+    stub = build_stub(args)
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), make_handler(stub))
+    source = f'{len(stub.replay)} recorded responses' if stub.replay else f'{len(stub.repos)} repos'
+    print(f"🧪 GitHub stub serving {source} on http://127.0.0.1:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
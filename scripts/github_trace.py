@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+GitHub Request Tracing
+----------------------
+Records every HTTP request sent to GitHub and writes a run metrics report.
+
+`RequestTracer` stands in for the `requests` module as the scheduler's session,
+so each attempt that actually goes over the wire is recorded: endpoint, repo,
+page, status, latency, response bytes and the rate-limit headers. Pagination
+that stops on an error response is reported through `truncated()` instead of
+ending silently.
+
+`write()` produces a machine-readable JSON report: per-endpoint p50/p95
+latency, the slowest repos, error counts by status, truncated paginations and
+the raw per-request log.
+
+Usage:
+    tracer = RequestTracer()
+    scheduler = RateLimitScheduler(session=tracer)
+    for page, items in iter_pages(cache.get, url, on_truncated=tracer.truncated): ...
+    tracer.write('fetch/fetch_metrics.json', extra={'cache': cache.stats})
+"""
+
+import re
+import json
+import time
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qsl
+
+import requests
+
+SLOWEST_REPOS = 10
+REPO_PATH = re.compile(r'^/repos/([^/]+/[^/]+)(/.*)?$')
+GRAPHQL_OPERATION = re.compile(r'(?:query|mutation)\s+(\w+)')
+
+
+def describe(method, url, params=None, body=None):
+    """(endpoint, repo, page) for a request, e.g. ('GET /repos/{repo}/commits', 'o/r', 2)."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({str(k): str(v) for k, v in (params or {}).items()})
+    path = parts.path.rstrip('/') or '/'
+
+    repo = None
+    match = REPO_PATH.match(path)
+    if match:
+        repo = match.group(1)
+        path = f'/repos/{{repo}}{match.group(2) or ""}'
+    elif path.endswith('/graphql') and body:
+        operation = GRAPHQL_OPERATION.search(body.get('query', ''))
+        path = f'/graphql {operation.group(1)}' if operation else '/graphql'
+
+    page = int(query['page']) if query.get('page', '').isdigit() else 1
+    return f'{method.upper()} {path}', repo, page
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class RequestTracer:
+    """Drop-in `session` that records every request it sends."""
+
+    def __init__(self, session=None, clock=time.perf_counter):
+        self.session = session or requests
+        self.clock = clock
+        self.records = []
+        self.truncations = []
+        self.started = clock()
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        endpoint, repo, page = describe(method, url, kwargs.get('params'), kwargs.get('json'))
+        record = {'endpoint': endpoint, 'repo': repo, 'page': page, 'url': url}
+        start = self.clock()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as e:
+            record.update(status=None, error=type(e).__name__, ms=round((self.clock() - start) * 1000, 1), bytes=0)
+            self._add(record)
+            raise
+
+        headers = response.headers
+        record.update(
+            status=response.status_code,
+            ms=round((self.clock() - start) * 1000, 1),
+            bytes=len(response.content or b''),
+            rate_remaining=headers.get('X-RateLimit-Remaining'),
+            rate_reset=headers.get('X-RateLimit-Reset'),
+            rate_resource=headers.get('X-RateLimit-Resource')
+        )
+        self._add(record)
+        return response
+
+    def _add(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def truncated(self, url, page, status):
+        """Pagination stopped early on an error response (see iter_pages)."""
+        endpoint, repo, _ = describe('GET', url)
+        with self._lock:
+            self.truncations.append({'endpoint': endpoint, 'repo': repo, 'page': page, 'status': status, 'url': url})
+        print(f"⚠️  Pagination stopped at page {page} ({status}): {url}")
+
+    def was_truncated(self, repo=None, endpoint=None):
+        """True if a pagination of `repo` (or, without a repo, of `endpoint`; with neither, any) stopped early."""
+        with self._lock:
+            if not repo and not endpoint:
+                return bool(self.truncations)
+            return any((t['repo'] == repo) if repo else (t['endpoint'] == endpoint) for t in self.truncations)
+
+    def metrics(self):
+        """Aggregate the recorded requests into the report structure."""
+        with self._lock:
+            records = list(self.records)
+            truncations = list(self.truncations)
+
+        endpoints = {}
+        for r in records:
+            endpoints.setdefault(r['endpoint'], []).append(r)
+
+        def is_error(r):
+            return r['status'] is None or r['status'] >= 400
+
+        by_endpoint = {}
+        for endpoint, items in sorted(endpoints.items()):
+            latencies = [r['ms'] for r in items]
+            by_endpoint[endpoint] = {
+                'requests': len(items),
+                'p50_ms': percentile(latencies, 50),
+                'p95_ms': percentile(latencies, 95),
+                'max_ms': max(latencies),
+                'bytes': sum(r['bytes'] for r in items),
+                'errors': sum(1 for r in items if is_error(r))
+            }
+
+        repos = {}
+        for r in records:
+            if r['repo']:
+                repo = repos.setdefault(r['repo'], {'repo': r['repo'], 'requests': 0, 'total_ms': 0.0, 'errors': 0})
+                repo['requests'] += 1
+                repo['total_ms'] = round(repo['total_ms'] + r['ms'], 1)
+                repo['errors'] += is_error(r)
+        slowest = sorted(repos.values(), key=lambda x: -x['total_ms'])[:SLOWEST_REPOS]
+
+        errors = {}
+        for r in records:
+            if is_error(r):
+                key = str(r['status']) if r['status'] is not None else r.get('error', 'error')
+                errors[key] = errors.get(key, 0) + 1
+
+        return {
+            'generated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'wall_seconds': round(self.clock() - self.started, 2),
+            'requests': len(records),
+            'bytes': sum(r['bytes'] for r in records),
+            'errors': errors,
+            'endpoints': by_endpoint,
+            'slowest_repos': slowest,
+            'truncated_paginations': truncations,
+            'log': records
+        }
+
+    def write(self, path, extra=None):
+        """Write the metrics (plus any `extra` sections) as JSON; returns the metrics."""
+        metrics = self.metrics()
+        metrics.update(extra or {})
+        with open(path, 'w') as f:
+            json.dump(metrics, f, indent=2)
+        return metrics
+
+    def summary(self, metrics=None):
+        """One-line, human readable summary."""
+        m = metrics or self.metrics()
+        errors = sum(m['errors'].values())
+        return (f"Requests: {m['requests']} sent, {m['bytes'] / 1024:.1f} KB, {errors} errors, "
+                f"{len(m['truncated_paginations'])} truncated paginations")
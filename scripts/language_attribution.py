@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Language Attribution
+--------------------
+Assigns a language to each commit / PR / issue of a repo in proportion to the
+repo's language breakdown (bytes per language from the Languages API).
+
+The distribution is precomputed once per repo and a whole batch of events is
+allocated in one call. Three modes:
+
+- seeded (default): each event draws from the distribution using a hash of its
+  key (commit SHA, PR/issue id). Stable per event, so incremental and full
+  syncs agree and identical inputs give byte-identical data.json output.
+- apportion: largest-remainder apportionment of the batch across languages,
+  interleaved with smooth weighted round-robin. Exact proportions within a
+  batch, but an incremental sync apportions only its new events (a batch of
+  one always goes to the top language), so it drifts from a full rebuild.
+- random: the original behaviour, one `random.random()` draw per event.
+"""
+
+import random
+import hashlib
+from bisect import bisect_left
+from itertools import accumulate
+
+MODES = ('seeded', 'apportion', 'random')
+DEFAULT_MODE = 'seeded'
+
+
+def largest_remainder(weights, n):
+    """Split `n` items across `weights` (Hamilton method); returns integer counts summing to n."""
+    total = sum(weights)
+    quotas = [w * n / total for w in weights]
+    counts = [int(q) for q in quotas]
+    # Hand the leftovers to the largest remainders; ties go to the heavier / earlier language
+    order = sorted(range(len(weights)), key=lambda i: (-(quotas[i] - counts[i]), -weights[i], i))
+    for i in order[:n - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def interleave(counts):
+    """Smooth weighted round-robin: yields each index exactly counts[i] times, evenly spread."""
+    total = sum(counts)
+    current = [0] * len(counts)
+    for _ in range(total):
+        for i, c in enumerate(counts):
+            current[i] += c
+        pick = max(range(len(counts)), key=lambda i: (current[i], -i))
+        current[pick] -= total
+        yield pick
+
+
+def hash_unit(key):
+    """Map a string key to a float in [0, 1)."""
+    digest = hashlib.sha1(key.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+
+class LanguageDistribution:
+    """Precomputed language distribution for one repo."""
+
+    def __init__(self, languages_bytes, fallback='Other'):
+        # Largest first (like the REST and GraphQL APIs), so the result doesn't depend on the response's key order
+        items = sorted(((lang, b) for lang, b in (languages_bytes or {}).items() if b > 0), key=lambda x: (-x[1], x[0]))
+        self.names = [lang for lang, _ in items]
+        self.weights = [b for _, b in items]
+        self.cumulative = list(accumulate(self.weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+        self.fallback = fallback
+
+    def _pick(self, unit):
+        return self.names[min(bisect_left(self.cumulative, unit * self.total), len(self.names) - 1)]
+
+    def allocate(self, n=None, mode=DEFAULT_MODE, keys=None, rng=random):
+        """Return a language for each of `n` events (or each key in `keys` for seeded mode)."""
+        if keys is not None:
+            n = len(keys)
+        if not self.total:
+            return [self.fallback] * n
+
+        if mode == 'apportion':
+            counts = largest_remainder(self.weights, n)
+            return [self.names[i] for i in interleave(counts)]
+        if mode == 'seeded':
+            if keys is None:
+                raise ValueError("seeded mode needs one key per event")
+            return [self._pick(hash_unit(key)) for key in keys]
+        if mode == 'random':
+            return [self._pick(rng.random()) for _ in range(n)]
+        raise ValueError(f"Unknown language attribution mode: {mode}")
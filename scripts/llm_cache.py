@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+------------------
+Content-addressed SQLite cache for the chat completions made by
+`agentic_chronicler.py`.
+
+Every successful call is stored in `.cache/llm/responses.sqlite3` (or
+$LLM_CACHE_PATH) under a hash of everything that determines the answer: the
+provider endpoint and the request payload (model, messages, temperature,
+JSON mode, sampling options). An identical request is answered from the store,
+so a council that failed in its last phase - or a re-run - only pays for the
+calls that didn't succeed before.
+
+Old and excess entries are evicted on close (see scripts/sqlite_lru.py).
+
+`PhaseCache` sits one level up: it keeps the output of each Council phase by
+project content signature, plus a hash of the job context for the phases that
+are tailored to it. The Engineer's analysis doesn't read the job context, so
+it is computed once per project version and shared by every company page.
+
+Usage:
+    cache = LLMCache()
+    key = request_key(url, payload)
+    content = cache.get(key)
+    if content is None:
+        content = ...call the provider...
+        cache.put(key, content, provider, payload['model'])
+    cache.close()   # evicts old/oversized entries and prints stats
+
+    phases = PhaseCache(path)
+    output = phases.get(project, signature, 'technical_analysis')
+    phases.put(project, signature, 'impact_pitch', job_hash, text)
+    phases.save()
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+from sqlite_lru import SQLiteLRUStore
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.getenv('LLM_CACHE_PATH') or os.path.join(ROOT_DIR, '.cache', 'llm', 'responses.sqlite3')
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024    # 50 MB
+DEFAULT_MAX_AGE = 90 * 24 * 60 * 60     # 90 days without being used
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS completions_last_used ON completions (last_used);
+"""
+
+
+def request_key(url, payload):
+    """Stable hash of a chat request: endpoint + payload (model, messages, temperature, ...)."""
+    raw = json.dumps([url, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class LLMCache(SQLiteLRUStore):
+    """Completion text by request hash, stored in one SQLite database."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE, enabled=True):
+        super().__init__(path, SCHEMA, 'completions', max_bytes, max_age, enabled)
+        self.stats.update({'hits': 0, 'misses': 0, 'stored': 0})
+
+    def get(self, key):
+        """The stored completion for `key`, or None."""
+        return self.get_any([key])
+
+    def get_any(self, keys):
+        """The stored completion for the first of `keys` that has one (one hit or miss), or None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            for key in keys:
+                row = self.db.execute('SELECT content FROM completions WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    self.db.execute('UPDATE completions SET last_used = ? WHERE key = ?', (time.time(), key))
+                    self.db.commit()
+                    self.stats['hits'] += 1
+                    return row[0]
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key, content, provider='', model=''):
+        """Store a successful completion."""
+        if not self.enabled or not content:
+            return
+        now = time.time()
+        with self._lock:
+            self.db.execute(
+                'INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, provider, model, content, now, now, len(content.encode('utf-8')))
+            )
+            self.db.commit()
+            self.stats['stored'] += 1
+
+    def summary(self):
+        s = self.stats
+        return f"💾 LLM cache: {s['hits']} hits, {s['misses']} misses, {s['stored']} stored, {s['evicted']} evicted"
+
+    def close(self):
+        """Run eviction, print the stats summary and close the database (nothing when disabled)."""
+        if self.enabled:
+            super().close()
+
+
+class PhaseCache:
+    """Council phase outputs by project, content signature and (for tailored phases) job context.
+
+    Stored as JSON next to the summary cache so it travels with the repo:
+
+        {"<project>": {"hash": "<content signature>",
+                       "phases": {"technical_analysis": "...", "impact_pitch@<job hash>": "..."}}}
+
+    A project's phases are dropped as soon as its content signature changes.
+    """
+
+    def __init__(self, path, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self.reuse_tailored = True   # False: only reuse phases that don't read the job context
+        self.entries = {}
+        self.stats = {'hits': 0, 'stored': 0}
+        self.dirty = False
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def phase_key(phase, job_hash=None):
+        return f"{phase}@{job_hash}" if job_hash else phase
+
+    def get(self, project, signature, phase, job_hash=None):
+        """The stored output of `phase` for this project version (and job context), or None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self.entries.get(project)
+            if not entry or entry.get('hash') != signature:
+                return None
+            output = entry['phases'].get(self.phase_key(phase, job_hash))
+            if output:
+                self.stats['hits'] += 1
+            return output
+
+    def put(self, project, signature, phase, job_hash, output):
+        """Store a phase output, replacing everything kept for an older version of the project."""
+        if not self.enabled or not output:
+            return
+        with self._lock:
+            entry = self.entries.get(project)
+            if not entry or entry.get('hash') != signature:
+                entry = self.entries[project] = {'hash': signature, 'phases': {}}
+            entry['phases'][self.phase_key(phase, job_hash)] = output
+            self.stats['stored'] += 1
+            self.dirty = True
+
+    def summary(self):
+        s = self.stats
+        return f"Council phase cache: {s['hits']} reused, {s['stored']} stored"
+
+    def save(self):
+        if not self.enabled or not self.dirty:
+            return
+        with self._lock:
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+            self.dirty = False
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+LLM Rate Limiter
+----------------
+Token-bucket limits for the LLM providers used by `agentic_chronicler.py`.
+
+Each provider gets one `RateLimiter`, shared by every thread calling it, with
+up to two buckets that refill continuously over a minute:
+
+- requests per minute (`rpm` in the provider's PROVIDERS entry);
+- tokens per minute (`tpm`): each call reserves an estimate of its prompt +
+  completion tokens up front and is settled with the real `usage.total_tokens`
+  afterwards.
+
+A 429 pauses the whole provider for the `Retry-After` the server asked for
+(see `retry_after()`), so concurrent callers back off together instead of each
+discovering the limit on its own.
+
+Usage:
+    limiter = limiter_for('groq', PROVIDERS['groq'])
+    reserved = limiter.acquire(estimate_tokens(messages))
+    response = requests.post(...)
+    limiter.settle(reserved, response.json()['usage']['total_tokens'])
+"""
+
+import time
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+COMPLETION_ALLOWANCE = 600   # tokens reserved for the answer until the real usage is known
+CHARS_PER_TOKEN = 4
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def estimate_tokens(messages):
+    """Rough prompt + completion token count for a chat request."""
+    chars = sum(len(m.get('content') or '') for m in messages)
+    return chars // CHARS_PER_TOKEN + COMPLETION_ALLOWANCE
+
+
+def retry_after(headers, now=None):
+    """Seconds to wait from a `Retry-After` header (delta-seconds or HTTP date), or None."""
+    value = (headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class TokenBucket:
+    """`capacity` units, refilled continuously at `capacity` per `period` seconds."""
+
+    def __init__(self, capacity, period=60.0, clock=time.monotonic):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.level = float(capacity)
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount):
+        """Seconds until `amount` units are available (requests bigger than the bucket wait for a full one)."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def take(self, amount):
+        self._refill()
+        self.level -= amount
+
+    def give(self, amount):
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Requests/minute + tokens/minute limits for one provider, shared across threads."""
+
+    def __init__(self, rpm=None, tpm=None, sleep=time.sleep, clock=time.monotonic):
+        self.requests = TokenBucket(rpm, clock=clock) if rpm else None
+        self.tokens = TokenBucket(tpm, clock=clock) if tpm else None
+        self.sleep = sleep
+        self.clock = clock
+        self.paused_until = 0.0
+        self.stats = {'calls': 0, 'waits': 0, 'wait_seconds': 0.0, 'rate_limited': 0}
+        self._lock = threading.Lock()
+
+    def _wait_time(self, tokens):
+        wait = max(0.0, self.paused_until - self.clock())
+        if self.requests:
+            wait = max(wait, self.requests.wait_time(1))
+        if self.tokens:
+            wait = max(wait, self.tokens.wait_time(tokens))
+        return wait
+
+    def acquire(self, tokens=0):
+        """Block until a request of ~`tokens` fits both buckets, then reserve it; returns the reservation."""
+        while True:
+            with self._lock:
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    if self.requests:
+                        self.requests.take(1)
+                    if self.tokens:
+                        self.tokens.take(tokens)
+                    self.stats['calls'] += 1
+                    return tokens
+                self.stats['waits'] += 1
+                self.stats['wait_seconds'] += wait
+            self.sleep(wait)
+
+    def settle(self, reserved, used):
+        """Correct a reservation with the tokens the call actually used."""
+        if not self.tokens or used is None:
+            return
+        with self._lock:
+            if used > reserved:
+                self.tokens.take(used - reserved)
+            else:
+                self.tokens.give(reserved - used)
+
+    def pause(self, seconds):
+        """Hold every caller for `seconds` (after a 429)."""
+        with self._lock:
+            self.stats['rate_limited'] += 1
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+    def summary(self):
+        s = self.stats
+        return f"{s['calls']} calls, {s['waits']} waits ({s['wait_seconds']:.0f}s), {s['rate_limited']} x 429"
+
+
+def limiter_for(provider, config):
+    """The shared limiter for `provider`, created from its PROVIDERS entry on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = RateLimiter(config.get('rpm'), config.get('tpm'))
+        return limiter
+
+
+def summaries():
+    """{provider: summary line} for every limiter used so far."""
+    with _limiters_lock:
+        return {provider: limiter.summary() for provider, limiter in _limiters.items()}
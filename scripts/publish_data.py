@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Data Publisher
+--------------
+Copies the fetch output (data.json or the year shards + data-manifest.json)
+into every page directory listed in scripts/publish_targets.json.
+
+Each source file is hashed once (SHA-256) and compared with the file already
+in each target. Unchanged targets are skipped; changed ones are written
+atomically (temp file in the target directory + os.replace), so a page never
+serves a half-written file and an interrupted run leaves every target either
+old or new. The changed paths are reported, and with --changed-list written
+one per line for `git add`.
+
+A page directory (one with an app.js) that is neither a target nor listed under
+`fetched_directly` (pages written by their own fetch profile) gets no data, so
+it is reported with a warning; add new pages to the manifest's `targets`.
+
+Usage:
+    python scripts/publish_data.py [--dry-run] [--changed-list published.txt]
+"""
+
+import os
+import glob
+import json
+import hashlib
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MANIFEST = os.path.join(ROOT_DIR, 'scripts', 'publish_targets.json')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, or None if it doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path, data):
+    """Write `data` to `path` via a temp file in the same directory and a rename."""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_targets(path=DEFAULT_MANIFEST):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def source_files(source_dir, patterns):
+    """Existing files in `source_dir` matching the manifest patterns, sorted by name."""
+    names = set()
+    for pattern in patterns:
+        names.update(os.path.basename(p) for p in glob.glob(os.path.join(source_dir, pattern)))
+    return sorted(names)
+
+
+def unlisted_pages(manifest, root=ROOT_DIR):
+    """Page directories (with an app.js) the manifest neither publishes to nor lists as fetched directly."""
+    listed = {os.path.normpath(d) for d in [manifest['source'], *manifest['targets'],
+                                            *manifest.get('fetched_directly', [])]}
+    pages = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d != 'node_modules')
+        if 'app.js' in filenames:
+            pages.add(os.path.relpath(dirpath, root))
+    return sorted(pages - listed)
+
+
+def publish(manifest, root=ROOT_DIR, dry_run=False):
+    """Publish every source file to every target; returns (changed paths, unchanged count)."""
+    source_dir = os.path.join(root, manifest['source'])
+    changed = []
+    unchanged = 0
+
+    for name in source_files(source_dir, manifest['files']):
+        with open(os.path.join(source_dir, name), 'rb') as f:
+            data = f.read()
+        digest = content_hash(data)
+
+        for target in manifest['targets']:
+            path = os.path.normpath(os.path.join(root, target, name))
+            if file_hash(path) == digest:
+                unchanged += 1
+                continue
+            if not dry_run:
+                atomic_write(path, data)
+            changed.append(os.path.relpath(path, root))
+
+    return changed, unchanged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish fetch output to every page directory")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST, help="Target manifest (default: scripts/publish_targets.json)")
+    parser.add_argument('--dry-run', action='store_true', help="Report what would change without writing")
+    parser.add_argument('--changed-list', help="Write the changed paths (one per line) to this file")
+    args = parser.parse_args()
+
+    manifest = load_targets(args.manifest)
+    for page in unlisted_pages(manifest):
+        print(f"Warning: {page}/ has an app.js but isn't in {os.path.relpath(args.manifest, ROOT_DIR)}; it gets no data")
+    changed, unchanged = publish(manifest, dry_run=args.dry_run)
+
+    verb = 'Would update' if args.dry_run else 'Updated'
+    for path in changed:
+        print(f'{verb} {path}')
+    print(f'{len(changed)} file(s) changed, {unchanged} unchanged across {len(manifest["targets"])} targets')
+
+    if args.changed_list:
+        with open(args.changed_list, 'w') as f:
+            f.writelines(f'{path}\n' for path in changed)
+
+
+if __name__ == '__main__':
+    main()
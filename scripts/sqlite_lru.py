@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SQLite LRU Store
+----------------
+Shared base of the persistent caches (`github_cache.ResponseCache`,
+`llm_cache.LLMCache`): one SQLite database, opened on first use and shared by
+every thread under a lock, whose table has `key`, `last_used` and `size`
+columns.
+
+On close, entries unused for `max_age` are dropped, then the least recently
+used ones until the table is under `max_bytes`.
+
+Usage:
+    class MyCache(SQLiteLRUStore):
+        def __init__(self, path):
+            super().__init__(path, SCHEMA, 'entries', max_bytes, max_age)
+        def summary(self):
+            return f"My cache: {self.stats['evicted']} evicted"
+
+    cache = MyCache(path)
+    with cache._lock:
+        cache.db.execute(...)
+    cache.close()   # evicts old/oversized entries and prints `summary()`
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+
+class SQLiteLRUStore:
+    """A SQLite table of sized entries with age + size based LRU eviction."""
+
+    def __init__(self, path, schema, table, max_bytes, max_age, enabled=True):
+        self.path = path
+        self.schema = schema
+        self.table = table
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.enabled = enabled
+        self.stats = {'evicted': 0}
+        self._lock = threading.Lock()
+        self._db = None
+
+    @property
+    def db(self):
+        """The SQLite connection, opened on first use (shared by all threads, guarded by `_lock`)."""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(self.schema)
+        return self._db
+
+    def evict(self):
+        """Drop entries unused for `max_age` seconds, then least-recently-used ones above `max_bytes`."""
+        if not self.enabled or not os.path.exists(self.path):
+            return
+
+        with self._lock:
+            db = self.db
+            cursor = db.execute(f'DELETE FROM {self.table} WHERE last_used < ?', (time.time() - self.max_age,))
+            evicted = cursor.rowcount
+
+            total = db.execute(f'SELECT COALESCE(SUM(size), 0) FROM {self.table}').fetchone()[0]
+            if total > self.max_bytes:
+                doomed = []
+                for key, size in db.execute(f'SELECT key, size FROM {self.table} ORDER BY last_used'):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                db.executemany(f'DELETE FROM {self.table} WHERE key = ?', doomed)
+                evicted += len(doomed)
+            db.commit()
+            self.stats['evicted'] += evicted
+
+    def summary(self):
+        """Return a one-line, human readable stats summary."""
+        return f"{self.table}: {self.stats['evicted']} evicted"
+
+    def close(self):
+        """Run eviction, print the stats summary and close the database."""
+        self.evict()
+        print(self.summary())
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,16 +1,34 @@
 // GitHub Service
 const GithubService = {
     username: 'akashagl92',
+    manifest: null,
     async fetchAllData() {
         // Check session cache first
         const cached = sessionStorage.getItem('github_data_v15');
         if (cached) return JSON.parse(cached);
 
+        try {
+            // Year-sharded data: load the current year now, older years on demand
+            const manifestResponse = await fetch('./data-manifest.json?v=15');
+            if (manifestResponse.ok) {
+                this.manifest = await manifestResponse.json();
+                let data = await this.loadShard(this.manifest.current);
+                if (data.totalCommits === 0) data = await this.loadOlderShards(data);
+                if (data.totalCommits > 0) {
+                    console.log(`Using pre-generated data from data-${this.manifest.current}.json`);
+                    sessionStorage.setItem('github_data_v15', JSON.stringify(data));
+                    return data;
+                }
+            }
+        } catch (e) {
+            console.log('data-manifest.json not available, trying data.json');
+        }
+
         try {
             // Try to load pre-generated data from build-time script
             const response = await fetch('./data.json?v=15');
             if (response.ok) {
-                const data = await response.json();
+                const data = this.decodeData(await response.json());
                 // Check if data.json has real content (not just placeholder)
                 if (data.totalCommits > 0) {
                     console.log('Using pre-generated data from data.json');
@@ -66,6 +84,163 @@ const GithubService = {
         }
     },
 
+    // Expand the compact columnar data.json (fetch_contributions.py --format compact)
+    // back into the { monthly, daily, languages, ... } shape the charts expect.
+    decodeData(data) {
+        if (!data || data.format !== 'compact') return data;
+
+        // Written with --no-daily: no events, the pages render from data.calendar
+        let daily;
+        if (data.daily) {
+            const { repos, languages, types } = data.strings;
+            const columns = data.daily;
+            const [year, month, day] = columns.start.split('-').map(Number);
+            const dates = {};
+            daily = columns.day.map((offset, i) => {
+                if (!(offset in dates)) dates[offset] = new Date(year, month - 1, day + offset).toDateString();
+                return {
+                    date: dates[offset],
+                    repo: repos[columns.repo[i]],
+                    language: languages[columns.language[i]],
+                    type: types[columns.type[i]]
+                };
+            });
+        }
+
+        // Version 2 stores calendar.days against the string table:
+        // { offset: [...], repos: [[id, count, ...], ...], languages: [...] }
+        let calendar = data.calendar;
+        if (calendar && data.version >= 2) {
+            const { repos, languages } = data.strings;
+            const counts = (flat, names) => {
+                const result = {};
+                for (let i = 0; i < flat.length; i += 2) result[names[flat[i]]] = flat[i + 1];
+                return result;
+            };
+            const days = {};
+            calendar.days.offset.forEach((offset, i) => {
+                days[offset] = {
+                    repos: counts(calendar.days.repos[i], repos),
+                    languages: counts(calendar.days.languages[i], languages)
+                };
+            });
+            calendar = { ...calendar, days };
+        }
+
+        return {
+            monthly: data.monthly.map(m => ({ ...m, languages: data.languages })),
+            totalCommits: data.totalCommits,
+            uniqueReposTotal: data.uniqueReposTotal,
+            daily,
+            languages: data.languages,
+            calendar
+        };
+    },
+
+    // Per-day { count, repos, languages } keyed by toDateString(). Built from the
+    // pre-aggregated calendar block(s) when present, otherwise from the raw events.
+    activityMap(data) {
+        const activityMap = {};
+        const calendars = data.calendars || [data.calendar];
+        if (calendars.every(Boolean)) {
+            calendars.filter(calendar => calendar.start).forEach(calendar => {
+                const [year, month, day] = calendar.start.split('-').map(Number);
+                Object.entries(calendar.days).forEach(([offset, info]) => {
+                    const date = new Date(year, month - 1, day + Number(offset)).toDateString();
+                    activityMap[date] = { count: calendar.counts[offset], repos: { ...info.repos }, languages: { ...info.languages } };
+                });
+            });
+            return activityMap;
+        }
+
+        (data.daily || []).forEach(d => {
+            if (!activityMap[d.date]) {
+                activityMap[d.date] = { count: 0, repos: {}, languages: {} };
+            }
+            activityMap[d.date].count++;
+            activityMap[d.date].repos[d.repo] = (activityMap[d.date].repos[d.repo] || 0) + 1;
+            activityMap[d.date].languages[d.language] = (activityMap[d.date].languages[d.language] || 0) + 1;
+        });
+        return activityMap;
+    },
+
+    // Fetch one year's shard listed in data-manifest.json
+    async loadShard(year) {
+        const shard = this.manifest.shards[year];
+        const response = await fetch(`./${shard.file}?v=15`);
+        if (!response.ok) throw new Error(`Shard ${shard.file} failed to load`);
+        const data = this.decodeData(await response.json());
+        data.years = [year];
+        return data;
+    },
+
+    // Add the shards for years not yet in `data`; resolves to `data` itself when there are none
+    async loadOlderShards(data) {
+        const manifest = this.manifest;
+        if (!manifest || !data.years) return data;
+
+        const missing = manifest.years.filter(year => !data.years.includes(year));
+        if (missing.length === 0) return data;
+
+        try {
+            const shards = await Promise.all(missing.map(year => this.loadShard(year)));
+            const merged = this.mergeShards([data, ...shards]);
+            sessionStorage.setItem('github_data_v15', JSON.stringify(merged));
+            return merged;
+        } catch (e) {
+            console.warn('Failed to load older data shards', e);
+            return data;
+        }
+    },
+
+    // Combine decoded year shards into one dataset (months are calendar months across years)
+    mergeShards(shards) {
+        const languages = {};
+        const allRepos = new Set();
+        const monthRepos = {};
+        shards.forEach(shard => {
+            Object.entries(shard.languages || {}).forEach(([lang, count]) => {
+                languages[lang] = (languages[lang] || 0) + count;
+            });
+            Object.entries(this.activityMap(shard)).forEach(([date, info]) => {
+                const month = new Date(date).getMonth();
+                monthRepos[month] = monthRepos[month] || new Set();
+                Object.keys(info.repos).forEach(repo => {
+                    monthRepos[month].add(repo);
+                    allRepos.add(repo);
+                });
+            });
+        });
+
+        const monthly = shards[0].monthly.map((month, i) => {
+            const topLangCounts = {};
+            shards.forEach(shard => {
+                Object.entries(shard.monthly[i].topLangCounts || {}).forEach(([lang, count]) => {
+                    topLangCounts[lang] = (topLangCounts[lang] || 0) + count;
+                });
+            });
+            return {
+                ...month,
+                count: shards.reduce((sum, shard) => sum + shard.monthly[i].count, 0),
+                uniqueRepos: monthRepos[i] ? monthRepos[i].size : 0,
+                languages,
+                topLangCounts
+            };
+        });
+
+        // Keep the raw events only if every shard has them; otherwise render from the calendars
+        const daily = shards.every(shard => shard.daily) ? shards.flatMap(shard => shard.daily) : undefined;
+        return {
+            monthly,
+            totalCommits: shards.reduce((sum, shard) => sum + shard.totalCommits, 0),
+            uniqueReposTotal: allRepos.size,
+            daily,
+            languages,
+            calendars: shards.flatMap(shard => shard.calendars || [shard.calendar]),
+            years: shards.flatMap(shard => shard.years)
+        };
+    },
+
     generateMockData() {
         // Simulating the 202+ contributions mentioned by user profile
         // Distribution: Python (60%), Neo4j (20%), Agents (20%)
@@ -156,6 +331,10 @@ document.addEventListener('DOMContentLoaded', async () => {
     const githubData = await GithubService.fetchAllData();
     if (githubData) {
         updateCharts(githubData);
+        // Older year shards load in the background, then the charts refresh
+        GithubService.loadOlderShards(githubData).then(full => {
+            if (full !== githubData) updateCharts(full);
+        });
     }
 
     // Existing interactivity
@@ -244,15 +423,7 @@ function updateCharts(data) {
     }
 
     // Build activity map with repo and language info for rich tooltips
-    const activityMap = {};
-    data.daily.forEach(d => {
-        if (!activityMap[d.date]) {
-            activityMap[d.date] = { count: 0, repos: {}, languages: {} };
-        }
-        activityMap[d.date].count++;
-        activityMap[d.date].repos[d.repo] = (activityMap[d.date].repos[d.repo] || 0) + 1;
-        activityMap[d.date].languages[d.language] = (activityMap[d.date].languages[d.language] || 0) + 1;
-    });
+    const activityMap = GithubService.activityMap(data);
 
     // Hero Calendar
     const heroCalendarGrid = document.getElementById('hero-calendar-grid');